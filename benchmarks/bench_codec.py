@@ -0,0 +1,151 @@
+"""Per-message encode/decode cost of Realtime API events.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_codec [--iterations 20000]
+
+"before" is what the client used to do for every event (``json.dumps`` of a
+dict with base64 audio, ``json.loads``); "after" is core.realtime_codec
+(orjson when installed, the append template, the pre-encoded commit). Also
+reports the longest event-loop stall while encoding a 30 s replay payload
+in one go versus incrementally.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import time
+
+from core import realtime_codec
+
+BLOCK_BYTES = 3200  # 100 ms of 16 kHz int16 mono
+REPLAY_BYTES = 16000 * 2 * 30
+
+RESPONSE_CREATE = {
+    "type": "response.create",
+    "event_id": "resp_42",
+    "response": {
+        "output_modalities": ["text"],
+        "metadata": {"event_id": "resp_42"},
+        "conversation": "none",
+        "input": [
+            {
+                "type": "message",
+                "role": "user",
+                "content": [
+                    {"type": "input_text", "text": "I think we should ship it."}
+                ],
+            }
+        ],
+    },
+}
+TEXT_DELTA = {
+    "type": "response.output_text.delta",
+    "event_id": "event_CWx7",
+    "response_id": "resp_CWx7",
+    "item_id": "item_CWx7",
+    "output_index": 0,
+    "content_index": 0,
+    "delta": "出荷すべきだと",
+}
+TRANSCRIPTION_DONE = {
+    "type": "conversation.item.input_audio_transcription.completed",
+    "event_id": "event_CWx8",
+    "item_id": "item_CWx8",
+    "content_index": 0,
+    "transcript": "I think we should ship it, but only after the review.",
+    "usage": {"type": "tokens", "total_tokens": 32, "input_tokens": 20},
+}
+
+
+def per_call_us(fn, arg, iterations):
+    for _ in range(100):
+        fn(arg)
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        fn(arg)
+    return (time.perf_counter_ns() - start) / iterations / 1000
+
+
+def old_append(pcm):
+    enc = base64.b64encode(pcm).decode()
+    return json.dumps({"type": "input_audio_buffer.append", "audio": enc})
+
+
+def old_commit(_):
+    return json.dumps({"type": "input_audio_buffer.commit"})
+
+
+def new_commit(_):
+    return realtime_codec.COMMIT_MESSAGE
+
+
+async def max_stall_ms(encode, payload):
+    """Longest gap a ticking task sees while ``encode(payload)`` runs."""
+    gaps = []
+
+    async def tick():
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0.01)
+    gaps.clear()
+    for _ in range(10):
+        await encode(payload)
+    ticker.cancel()
+    return max(gaps) * 1000
+
+
+async def encode_inline(payload):
+    realtime_codec.encode_append(payload)
+    await asyncio.sleep(0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    block = os.urandom(BLOCK_BYTES)
+    encoded = {
+        name: json.dumps(event)
+        for name, event in [
+            ("text delta", TEXT_DELTA),
+            ("transcription done", TRANSCRIPTION_DONE),
+        ]
+    }
+    cases = [
+        ("encode append 100ms", old_append, realtime_codec.encode_append, block),
+        ("encode commit", old_commit, new_commit, None),
+        ("encode response.create", json.dumps, realtime_codec.dumps, RESPONSE_CREATE),
+    ] + [
+        (f"decode {name}", json.loads, realtime_codec.loads, raw)
+        for name, raw in encoded.items()
+    ]
+
+    print(f"backend: {realtime_codec.backend()}, {n} iterations per case")
+    print(f"{'message':<28}{'before us':>11}{'after us':>11}{'speedup':>9}")
+    for name, before, after, arg in cases:
+        old = per_call_us(before, arg, n)
+        new = per_call_us(after, arg, n)
+        print(f"{name:<28}{old:>11.2f}{new:>11.2f}{old / new:>8.1f}x")
+
+    replay = os.urandom(REPLAY_BYTES)
+    inline = asyncio.run(max_stall_ms(encode_inline, replay))
+    sliced = asyncio.run(max_stall_ms(realtime_codec.encode_append_async, replay))
+    print(
+        f"\nloop stall encoding {REPLAY_BYTES // 1000} KB: "
+        f"inline {inline:.2f} ms, incremental {sliced:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""End-to-end RealtimeAPIClient benchmark against the local mock server.
+
+Run from the repository root (no API key or network needed):
+
+    python -m benchmarks.bench_realtime [--utterances 10] [--speed 1.0]
+        [--translation-connections 1] [--error-rate 0] [--drop-every N]
+
+Synthetic speech (voiced bursts with pauses) is fed block by block through
+AudioStreamManager's capture callback, so the real sender (VAD, coalescing,
+commits) and receivers (captions, translations) run unchanged against
+benchmarks/mock_realtime_server.py. ``--speed`` feeds audio faster than real
+time. Reports per-utterance latency from the client's LatencyTracer and
+message throughput per event type.
+"""
+
+import argparse
+import asyncio
+import time
+from queue import Empty, Queue
+
+import numpy as np
+
+from benchmarks.mock_realtime_server import MockRealtimeServer
+from core.audio_manager import AudioStreamManager
+from core.config_manager import ConfigManager
+from core.config_storage import StorageBackend
+from core.message_types import UIMessageMixin, UIMessageType
+from core.realtime_api_manager import RealtimeAPIClient
+
+
+class BenchmarkStorage(StorageBackend):
+    """In-memory config: no keychain, no cache or trace files."""
+
+    def __init__(self, translation_connections):
+        self.data = {
+            "TRANSLATION_CONNECTIONS": translation_connections,
+            "TRANSLATION_CACHE_PERSIST": False,
+            "LATENCY_TRACE": False,
+        }
+
+    def load(self):
+        return dict(self.data)
+
+    def save(self, data):
+        self.data = dict(data)
+
+    def get_secret(self, key):
+        return "mock-key"
+
+
+def synthetic_utterance(samplerate, speech_seconds, silence_seconds, rng):
+    """Voiced harmonics with a syllable-rate envelope, then low noise."""
+    t = np.arange(int(samplerate * speech_seconds)) / samplerate
+    f0 = rng.uniform(110, 220)
+    voice = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 6))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t) ** 2
+    speech = 0.15 * voice * envelope
+    silence = rng.normal(0, 0.0005, int(samplerate * silence_seconds))
+    return np.concatenate([speech, silence]).astype(np.float32)
+
+
+async def feed_audio(manager, signal, speed):
+    """Push ``signal`` through the capture callback at ``speed`` x real time."""
+    block = manager.blocksize
+    block_seconds = block / manager.samplerate
+    start = time.perf_counter()
+    for i, offset in enumerate(range(0, len(signal) - block + 1, block)):
+        frame = signal[offset : offset + block].reshape(-1, 1)
+        manager.callback(frame, block, None, None)
+        delay = start + (i + 1) * block_seconds / speed - time.perf_counter()
+        await asyncio.sleep(max(delay, 0))
+
+
+def drain(queue, counts):
+    while True:
+        try:
+            msg = queue.get_nowait()
+        except Empty:
+            return
+        counts[msg["type"]] = counts.get(msg["type"], 0) + 1
+
+
+async def run(args):
+    ConfigManager.configure(BenchmarkStorage(args.translation_connections))
+    ui_queue = Queue()
+    UIMessageMixin.set_ui_queue(ui_queue)
+
+    server = await MockRealtimeServer(
+        transcription_delay=args.transcription_delay,
+        response_delay=args.response_delay,
+        error_rate=args.error_rate,
+        drop_every=args.drop_every,
+    ).start()
+
+    manager = AudioStreamManager()
+    manager.enabled = True  # capture callback without a PortAudio stream
+    client = RealtimeAPIClient()
+    client.ws_url = server.url
+    client.start()
+    while not (client.transcription and client.transcription.ready):
+        await asyncio.sleep(0.01)
+
+    rng = np.random.default_rng(0)
+    signal = np.concatenate(
+        [
+            synthetic_utterance(manager.samplerate, args.speech, args.silence, rng)
+            for _ in range(args.utterances)
+        ]
+    )
+    counts = {}
+    started = time.perf_counter()
+    await feed_audio(manager, signal, args.speed)
+    fed = time.perf_counter() - started
+
+    # Wait for the last translations (or give up after --timeout).
+    deadline = time.perf_counter() + args.timeout
+    while time.perf_counter() < deadline:
+        drain(ui_queue, counts)
+        if counts.get(UIMessageType.TRANSLATED, 0) >= args.utterances:
+            break
+        await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - started
+
+    percentiles = client.latency.percentiles()
+    event_stats = client.events.stats()
+    client.stop()
+    while client.main_task and not client.main_task.done():
+        await asyncio.sleep(0.05)
+    manager.enabled = False
+    await server.stop()
+    drain(ui_queue, counts)
+
+    audio_seconds = len(signal) / manager.samplerate
+    print(
+        f"{args.utterances} utterances, {audio_seconds:.1f}s audio fed in {fed:.1f}s "
+        f"({args.speed}x), total {elapsed:.1f}s, reconnects: "
+        f"{server.connections - 1 - args.translation_connections}"
+    )
+    print(
+        f"captions: {counts.get(UIMessageType.CAPTION, 0)}, "
+        f"translations: {counts.get(UIMessageType.TRANSLATED, 0)}"
+    )
+
+    print(f"\n{'latency (ms)':<34}{'p50':>9}{'p95':>9}{'n':>5}")
+    for name, (p50, p95, n) in percentiles.items():
+        print(f"{name:<34}{p50:>9.1f}{p95:>9.1f}{n:>5}")
+
+    print(f"\n{'client -> server':<40}{'count':>8}{'per s':>9}")
+    for event_type, count in server.received.most_common():
+        print(f"{event_type:<40}{count:>8}{count / elapsed:>9.1f}")
+    print(f"\n{'server -> client':<52}{'count':>8}{'handler ms':>12}")
+    for event_type, count in server.sent.most_common():
+        handled = event_stats.get(event_type, {}).get("total_ms", 0.0)
+        print(f"{event_type:<52}{count:>8}{handled:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--utterances", type=int, default=10)
+    parser.add_argument("--speech", type=float, default=1.5, help="seconds")
+    parser.add_argument("--silence", type=float, default=1.0, help="seconds")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--translation-connections", type=int, default=1)
+    parser.add_argument("--transcription-delay", type=float, default=0.3)
+    parser.add_argument("--response-delay", type=float, default=0.15)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--drop-every", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=15.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
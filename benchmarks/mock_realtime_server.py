@@ -0,0 +1,280 @@
+"""Local stand-in for the OpenAI Realtime websocket API.
+
+Implements just enough of the protocol for RealtimeAPIClient:
+
+- session.update -> session.updated
+- input_audio_buffer.append / commit -> input_audio_buffer.committed, then
+  transcription deltas and conversation.item.input_audio_transcription.completed
+- response.create -> response.created, response.output_text.delta(s),
+  response.output_text.done, response.done
+
+Transcripts are synthetic ("utterance 3 (1.2s)") and translations echo the
+input with a prefix, keeping [[n]] batch markers. Delays are configurable,
+and failures can be injected: ``error_rate`` rejects response.create with an
+error event, ``drop_every`` closes a connection after that many received
+messages.
+
+Run standalone (prints the URL to point REALTIME_WS_URL at):
+
+    python -m benchmarks.mock_realtime_server [--port 8765]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+from collections import Counter
+
+import websockets
+
+SEGMENT = re.compile(r"(\[\[\d+\]\])")
+
+
+class MockRealtimeServer:
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        samplerate=16000,
+        session_delay=0.05,
+        commit_delay=0.05,
+        transcription_delay=0.3,
+        transcription_deltas=3,
+        response_delay=0.15,
+        response_deltas=3,
+        delta_interval=0.02,
+        error_rate=0.0,
+        drop_every=None,
+        seed=0,
+    ):
+        self.host = host
+        self.port = port
+        self.samplerate = samplerate
+        self.session_delay = session_delay
+        self.commit_delay = commit_delay
+        self.transcription_delay = transcription_delay
+        self.transcription_deltas = transcription_deltas
+        self.response_delay = response_delay
+        self.response_deltas = response_deltas
+        self.delta_interval = delta_interval
+        self.error_rate = error_rate
+        self.drop_every = drop_every
+        self.random = random.Random(seed)
+
+        self.received = Counter()
+        self.sent = Counter()
+        self.connections = 0
+        self.drops = 0
+        self._server = None
+        self._items = 0
+        self._responses = 0
+        self._errors = 0
+
+    @property
+    def url(self):
+        return f"ws://{self.host}:{self.port}/v1/realtime?model=mock"
+
+    async def start(self):
+        self._server = await websockets.serve(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    # ==========================================================
+    # Connection
+    # ==========================================================
+
+    async def _handle(self, ws, path=None):
+        self.connections += 1
+        state = {"buffer": 0, "received": 0}
+        tasks = set()
+        try:
+            async for raw in ws:
+                msg = json.loads(raw)
+                t = msg.get("type")
+                self.received[t] += 1
+                state["received"] += 1
+                if self.drop_every and state["received"] % self.drop_every == 0:
+                    self.drops += 1
+                    await ws.close(code=1011, reason="injected drop")
+                    break
+
+                if t == "session.update":
+                    await asyncio.sleep(self.session_delay)
+                    await self._send(
+                        ws, {"type": "session.updated", "session": msg["session"]}
+                    )
+                elif t == "input_audio_buffer.append":
+                    # base64: 4 chars per 3 bytes (padding is close enough here).
+                    state["buffer"] += len(msg.get("audio", "")) * 3 // 4
+                elif t == "input_audio_buffer.commit":
+                    size, state["buffer"] = state["buffer"], 0
+                    self._spawn(tasks, self._commit(ws, size))
+                elif t == "response.create":
+                    self._spawn(tasks, self._respond(ws, msg))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _spawn(tasks, coro):
+        task = asyncio.create_task(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def _send(self, ws, event):
+        self.sent[event["type"]] += 1
+        await ws.send(json.dumps(event))
+
+    # ==========================================================
+    # Events
+    # ==========================================================
+
+    async def _commit(self, ws, size):
+        if size == 0:
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "error": {
+                        "type": "invalid_request_error",
+                        "code": "input_audio_buffer_commit_empty",
+                        "message": "buffer is empty",
+                    },
+                },
+            )
+            return
+
+        self._items += 1
+        number = self._items
+        item_id = f"item_{number}"
+        await asyncio.sleep(self.commit_delay)
+        await self._send(
+            ws, {"type": "input_audio_buffer.committed", "item_id": item_id}
+        )
+
+        seconds = size / 2 / self.samplerate
+        transcript = f"utterance {number} ({seconds:.1f}s)"
+        await asyncio.sleep(self.transcription_delay)
+        for piece in self._pieces(transcript, self.transcription_deltas):
+            await self._send(
+                ws,
+                {
+                    "type": "conversation.item.input_audio_transcription.delta",
+                    "item_id": item_id,
+                    "delta": piece,
+                },
+            )
+            await asyncio.sleep(self.delta_interval)
+        await self._send(
+            ws,
+            {
+                "type": "conversation.item.input_audio_transcription.completed",
+                "item_id": item_id,
+                "transcript": transcript,
+            },
+        )
+
+    async def _respond(self, ws, msg):
+        event_id = msg.get("event_id")
+        body = msg.get("response", {})
+        if self.error_rate and self.random.random() < self.error_rate:
+            self._errors += 1
+            # Like the real API: the top-level event_id is the server's own,
+            # error.event_id names the rejected client event.
+            await self._send(
+                ws,
+                {
+                    "type": "error",
+                    "event_id": f"event_error_{self._errors}",
+                    "error": {
+                        "type": "server_error",
+                        "code": "injected_error",
+                        "message": "injected by MockRealtimeServer",
+                        "event_id": event_id,
+                    },
+                },
+            )
+            return
+
+        self._responses += 1
+        response_id = f"resp_{self._responses}"
+        response = {"id": response_id, "metadata": body.get("metadata")}
+        await self._send(ws, {"type": "response.created", "response": response})
+
+        text = self._translate(self._input_text(body))
+        await asyncio.sleep(self.response_delay)
+        for piece in self._pieces(text, self.response_deltas):
+            await self._send(
+                ws,
+                {
+                    "type": "response.output_text.delta",
+                    "response_id": response_id,
+                    "delta": piece,
+                },
+            )
+            await asyncio.sleep(self.delta_interval)
+        await self._send(
+            ws,
+            {
+                "type": "response.output_text.done",
+                "response_id": response_id,
+                "text": text,
+            },
+        )
+        await self._send(
+            ws,
+            {"type": "response.done", "response": {**response, "status": "completed"}},
+        )
+
+    @staticmethod
+    def _input_text(body):
+        for item in body.get("input") or []:
+            for content in item.get("content", []):
+                if content.get("text"):
+                    return content["text"]
+        return ""
+
+    @staticmethod
+    def _translate(text):
+        parts = SEGMENT.split(text)
+        if len(parts) == 1:
+            return f"訳:{text.strip()}"
+        # Keep every [[n]] marker on its own line, as the batch prompt asks.
+        out = []
+        for marker, body in zip(parts[1::2], parts[2::2]):
+            out.append(f"{marker} 訳:{body.strip()}")
+        return "\n".join(out)
+
+    @staticmethod
+    def _pieces(text, count):
+        count = max(1, count)
+        step = max(1, -(-len(text) // count))
+        return [text[i : i + step] for i in range(0, len(text), step)]
+
+
+async def serve_forever(port):
+    server = await MockRealtimeServer(port=port).start()
+    print(f"Mock Realtime API listening on {server.url}")
+    await asyncio.Future()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve_forever(args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
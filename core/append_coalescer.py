@@ -0,0 +1,59 @@
+import time
+
+
+class AppendCoalescer:
+    """Merge captured PCM frames into fewer input_audio_buffer.append messages.
+
+    When the websocket keeps up, every frame is sent on its own so latency stays
+    at one block. When the socket is backed up (or frames piled up during a
+    stall) frames are merged, holding the oldest one for at most ``max_latency``
+    seconds and never sending more than ``max_payload_bytes`` in one append.
+    """
+
+    def __init__(self, max_latency=0.2, max_payload_bytes=16000 * 2 * 2):
+        self.max_latency = max_latency
+        self.max_payload_bytes = max_payload_bytes
+        self._frames = []
+        self._size = 0
+        self._first_at = None
+
+    def __len__(self):
+        return self._size
+
+    def add(self, pcm_bytes, volume):
+        if not self._frames:
+            self._first_at = time.time()
+        self._frames.append((pcm_bytes, volume))
+        self._size += len(pcm_bytes)
+
+    def is_full(self):
+        return self._size >= self.max_payload_bytes
+
+    def deadline(self):
+        """Latest time the oldest buffered frame may still wait."""
+        if self._first_at is None:
+            return None
+        return self._first_at + self.max_latency
+
+    def take(self):
+        """Pop up to ``max_payload_bytes`` of PCM as ``(bytes, last_volume)``.
+
+        At least one frame is always returned; frames that do not fit stay
+        buffered for the next call.
+        """
+        count = 0
+        size = 0
+        for pcm_bytes, _ in self._frames:
+            if count and size + len(pcm_bytes) > self.max_payload_bytes:
+                break
+            size += len(pcm_bytes)
+            count += 1
+
+        frames = self._frames[:count]
+        self._frames = self._frames[count:]
+        self._size -= size
+        self._first_at = time.time() if self._frames else None
+
+        if count == 1:
+            return frames[0]
+        return b"".join(f[0] for f in frames), frames[-1][1]
@@ -1,12 +1,20 @@
-import sounddevice as sd
+import asyncio
 import threading
+import time
 import numpy as np
 from core.message_types import UIMessageType, UIMessageMixin
-from queue import Queue
+from core.noise_suppression import AmplitudeGate, SpectralGate
+
+try:
+    import sounddevice as sd
+except (ImportError, OSError):
+    # No PortAudio (e.g. a headless server): file sources still work.
+    sd = None
 
 
 class AudioStreamManager(UIMessageMixin):
     _instance = None
+    log_subsystem = "audio"
     _lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
@@ -27,11 +35,44 @@ class AudioStreamManager(UIMessageMixin):
         self.callback = self.default_audio_callback
         self.enabled = False
         self.min_volume_for_speech = 5
-        self.audio_queue = Queue()
-        self.noise_floor = None
+        # Quiet audio kept around loud blocks so word onsets/endings survive
+        # the min_volume_for_speech gate.
+        self.pre_roll_ms = 300
+        self.post_roll_ms = 200
+
+        # Capture ring buffer: one int16 row per block, written by the PortAudio
+        # callback and read by the consumer. Block indices grow monotonically;
+        # slot = index % ring_blocks. Everything is allocated up front so the
+        # callback never allocates NumPy arrays.
+        self.ring_seconds = 10
+        self.ring_blocks = self.ring_seconds * self.samplerate // self.blocksize
+        self._ring = np.zeros((self.ring_blocks, self.blocksize), dtype=np.int16)
+        self._ring_volumes = np.zeros(self.ring_blocks, dtype=np.float32)
+        self._ring_lengths = np.zeros(self.ring_blocks, dtype=np.int32)
+        self._ring_times = np.zeros(self.ring_blocks, dtype=np.float64)
+        self._clock = time.time  # the callback's ``time`` argument shadows the module
+        self._scaled = np.zeros(self.blocksize, dtype=np.float32)
+        self._abs = np.zeros(self.blocksize, dtype=np.float32)
+        self._write_index = 0
+        self._read_index = 0
+        # Where the current mic session began; the first fresh consumer reads
+        # from here so speech captured before it attached is not lost.
+        self._start_index = None
+        self.overruns = 0
+        self.status_errors = 0
+
+        # (loop, asyncio.Event) of the consumer, swapped as a single reference so
+        # the PortAudio thread never sees a half-updated pair.
+        self._wakeup = None
+        self._wakeup_pending = False
 
         self._initialized = True
         self._noise_reduction_enabled = True
+        self._noise_reducers = {
+            "gate": AmplitudeGate(self.blocksize),
+            "spectral": SpectralGate(self.blocksize),
+        }
+        self.noise_reduction_mode = "gate"
 
     def enable_noise_reduction(self):
         self._noise_reduction_enabled = True
@@ -52,6 +93,16 @@ class AudioStreamManager(UIMessageMixin):
     def is_noise_reduction_enabled(self):
         return self._noise_reduction_enabled
 
+    def get_noise_reduction_modes(self):
+        return list(self._noise_reducers)
+
+    def set_noise_reduction_mode(self, mode):
+        if mode not in self._noise_reducers:
+            self.ui_msg(UIMessageType.SYS_LOG, f"⚠️ Unknown noise reduction: {mode}")
+            return
+        self.noise_reduction_mode = mode
+        self.ui_msg(UIMessageType.SYS_LOG, f"🎛 Noise Reduction mode: {mode}")
+
     # ------------------------------------------------
 
     def set_device(self, device_index):
@@ -71,6 +122,9 @@ class AudioStreamManager(UIMessageMixin):
     def start(self):
         if self.enabled:
             return
+        if sd is None:
+            self.ui_msg(UIMessageType.SYS_LOG, "❌ Mic start error: no sounddevice")
+            return
 
         try:
             self.stream = sd.InputStream(
@@ -81,6 +135,7 @@ class AudioStreamManager(UIMessageMixin):
                 device=self.device_index,
                 callback=self.callback,
             )
+            self._start_index = self._write_index
             self.stream.start()
             self.enabled = True
 
@@ -108,6 +163,12 @@ class AudioStreamManager(UIMessageMixin):
         self.enabled = False
 
         self.ui_msg(UIMessageType.SYS_LOG, "🛑 Mic OFF")
+        if self.status_errors or self.overruns:
+            self.ui_msg(
+                UIMessageType.LOG,
+                f"⚠️ Capture issues: status={self.status_errors}, "
+                f"ring overruns={self.overruns}",
+            )
 
     # ------------------------------------------------
 
@@ -120,20 +181,90 @@ class AudioStreamManager(UIMessageMixin):
     def is_on(self):
         return self.enabled
 
-    def noise_reduction(self, pcm):
-        abs_pcm = np.abs(pcm)
+    # ------------------------------------------------
 
-        if self.noise_floor is None:
-            self.noise_floor = abs_pcm.mean()
+    def attach_consumer(self, loop, resume=False):
+        """Register the consumer running on ``loop``.
+
+        Returns an asyncio.Event that is set whenever a block at or above
+        ``min_volume_for_speech`` has been captured. Reading starts where
+        the mic was started if this is the session's first consumer (the
+        socket is often ready only after the first words), otherwise from the
+        newest block; with ``resume`` it continues where the previous
+        consumer stopped. Either way only as far back as the ring reaches.
+        """
+        event = asyncio.Event()
+        if not resume or self._read_index > self._write_index:
+            if self._start_index is not None:
+                oldest = self._write_index - self.ring_blocks + 1
+                self._read_index = max(self._start_index, oldest)
+            else:
+                self._read_index = self._write_index
+        self._start_index = None
+        self._wakeup_pending = False
+        self._wakeup = (loop, event)
+        return event
+
+    def detach_consumer(self):
+        self._wakeup = None
+
+    def read_blocks(self):
+        """Return ``(pcm, volume, captured_at)`` for every block since the last call.
+
+        ``pcm`` is a zero-copy byte memoryview into the ring buffer. It stays
+        valid until the writer wraps around (``ring_seconds``), so consumers
+        must copy or send it well before that.
+        """
+        write_index = self._write_index
+        # The slot of ``write_index`` itself may be under construction.
+        oldest = write_index - self.ring_blocks + 1
+        if self._read_index < oldest:
+            self.overruns += oldest - self._read_index
+            self._read_index = oldest
+
+        blocks = []
+        for index in range(self._read_index, write_index):
+            slot = index % self.ring_blocks
+            length = self._ring_lengths[slot]
+            blocks.append(
+                (
+                    memoryview(self._ring[slot, :length]).cast("B"),
+                    float(self._ring_volumes[slot]),
+                    float(self._ring_times[slot]),
+                )
+            )
+        self._read_index = write_index
+        return blocks
+
+    def latest_volume(self):
+        if self._write_index == 0:
+            return 0.0
+        return float(self._ring_volumes[(self._write_index - 1) % self.ring_blocks])
+
+    def _notify_consumer(self):
+        # Runs on the PortAudio thread: at most one pending wakeup per consumer.
+        wakeup = self._wakeup
+        if wakeup is None or self._wakeup_pending:
+            return
+        loop, event = wakeup
+        self._wakeup_pending = True
+        try:
+            loop.call_soon_threadsafe(self._set_wakeup, event)
+        except RuntimeError:
+            # Loop already closed (realtime client stopped).
+            self._wakeup_pending = False
+
+    def _set_wakeup(self, event):
+        self._wakeup_pending = False
+        event.set()
 
-        # Update the noise floor slowly using a 0.95 smoothing factor.
-        self.noise_floor = 0.95 * self.noise_floor + 0.05 * abs_pcm.mean()
-        self.noise_floor = max(self.noise_floor, 1e-6)
-        # Suppress sounds below the noise floor.
-        scale = np.clip(abs_pcm / (self.noise_floor * 1.5), 0, 1)
-        return (pcm * scale).astype(np.int16)
+    def noise_reduction(self, samples, out):
+        """Run the selected noise reducer on float32 ``samples`` into int16 ``out``."""
+        return self._noise_reducers[self.noise_reduction_mode].process(samples, out)
 
     def get_input_devices(self):
+        if sd is None:
+            return []
         devices = sd.query_devices()
         input_devices = []
         for idx, d in enumerate(devices):
@@ -143,18 +274,31 @@ class AudioStreamManager(UIMessageMixin):
         return [f"{idx}: {name}" for idx, name in input_devices]
 
     def default_audio_callback(self, indata, frames, time, status):
+        # Real-time path: no logging, no queues, no per-block array allocation.
+        # The noise reducers work entirely in their own preallocated buffers.
         if not self.enabled:
             return
-        pcm = (indata[:, 0] * 32767).astype(np.int16)
+        if status:
+            self.status_errors += 1
+
+        frames = min(frames, self.blocksize)
+        slot = self._write_index % self.ring_blocks
+        scaled = self._scaled[:frames]
+        pcm = self._ring[slot, :frames]
+
+        np.multiply(indata[:frames, 0], 32767, out=scaled)
         if self._noise_reduction_enabled:
-            pcm = self.noise_reduction(pcm)
-        volume = np.abs(pcm).mean()
+            self.noise_reduction(scaled, pcm)
+        else:
+            np.clip(scaled, -32767, 32767, out=scaled)
+            np.copyto(pcm, scaled, casting="unsafe")
 
-        try:
-            level = volume
-            self.ui_msg(UIMessageType.VOLUME, str(level))
-        except Exception:
-            pass
+        volume = np.abs(pcm, out=self._abs[:frames]).mean()
+        self._ring_volumes[slot] = volume
+        self._ring_lengths[slot] = frames
+        self._ring_times[slot] = self._clock()
+        # Publish the block only after its data is in place.
+        self._write_index += 1
 
         if volume >= self.min_volume_for_speech:
-            self.audio_queue.put((pcm.tobytes(), volume))
+            self._notify_consumer()
@@ -0,0 +1,35 @@
+import json
+import os
+from .config_storage import StorageBackend
+
+
+class EnvStorage(StorageBackend):
+    """Config from environment variables, for headless runs.
+
+    ``PEPE_<KEY>`` sets config key ``<KEY>`` (JSON values are decoded, so
+    ``PEPE_TRANSLATION_CONNECTIONS=2`` is an int). The API key comes from
+    ``OPENAI_API_KEY``. Changes are kept in memory only.
+    """
+
+    PREFIX = "PEPE_"
+    SECRETS = {"API_KEY": "OPENAI_API_KEY"}
+
+    def load(self) -> dict:
+        data = {}
+        for name, value in os.environ.items():
+            if not name.startswith(self.PREFIX):
+                continue
+            try:
+                data[name[len(self.PREFIX) :]] = json.loads(value)
+            except ValueError:
+                data[name[len(self.PREFIX) :]] = value
+        return data
+
+    def save(self, data: dict) -> None:
+        pass
+
+    def get_secret(self, key):
+        return os.environ.get(self.SECRETS.get(key, self.PREFIX + key))
+
+    def set_secret(self, key, value):
+        os.environ[self.SECRETS.get(key, self.PREFIX + key)] = value
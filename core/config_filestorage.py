@@ -1,9 +1,34 @@
+import contextlib
 import json
+import os
+import tempfile
 from pathlib import Path
 from core.config_storage import StorageBackend
 
 
+def atomic_write_text(path, text):
+    """Replace ``path`` with ``text``; a crash leaves the old file or the new one.
+
+    The data goes to a temporary file in the same directory (created 0600),
+    is fsynced, and is then renamed over ``path``.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
 class FileStorage(StorageBackend):
+    # get_secret/set_secret keep secrets in config.json itself.
+    SECRETS_IN_FILE = True
+
     def __init__(self):
         self.path = (
             Path.home()
@@ -23,8 +48,7 @@ class FileStorage(StorageBackend):
         return {}
 
     def save(self, data):
-        self.path.write_text(json.dumps(data, indent=2))
-        self.path.chmod(0o600)
+        atomic_write_text(self.path, json.dumps(data, indent=2))
 
     def get_secret(self, key):
         return self.load().get(key)
@@ -1,16 +1,13 @@
 # core/config_keyringstorage.py
 import keyring
-from .config_storage import StorageBackend
+from .config_filestorage import FileStorage
 
 
-class KeyringStorage(StorageBackend):
-    SERVICE = "PepeTranslator"
-
-    def load(self) -> dict:
-        return {}
+class KeyringStorage(FileStorage):
+    """Secrets in the keychain; every other setting in config.json."""
 
-    def save(self, data: dict) -> None:
-        pass
+    SERVICE = "PepeTranslator"
+    SECRETS_IN_FILE = False
 
     def get(self, key, default=None):
         value = keyring.get_password(self.SERVICE, key)
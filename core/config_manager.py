@@ -1,12 +1,27 @@
+import atexit
 import threading
 from core.config_filestorage import FileStorage
+from core.log_manager import get_logger
+
+logger = get_logger("config")
 
 
 class ConfigManager:
+    """Process-wide settings, held in memory.
+
+    Reads never touch the backend after startup. Writes update memory at
+    once, notify subscribers (see ``subscribe()``) and reach the backend
+    write-behind: all changes within ``SAVE_DELAY`` seconds go out in one
+    save (``flush()`` forces it; it also runs at exit). Secrets are looked
+    up once and kept until ``set_api_key()`` or ``invalidate_secrets()``.
+    """
+
     _instance = None
     _lock = threading.Lock()
     _backend = None  # plugin for saving config
 
+    SAVE_DELAY = 0.5
+
     @classmethod
     def configure(cls, backend):
         if cls._instance is not None:
@@ -28,32 +43,123 @@ class ConfigManager:
 
         self.backend = self.__class__._backend
         self._data = self.backend.load() if hasattr(self.backend, "load") else {}
+        self._data_lock = threading.RLock()
+        self._secrets = {}
+        self._subscribers = {}
+        # The prompt lives with the other settings when the backend stores
+        # files (FileStorage, KeyringStorage) or provides one itself (e.g.
+        # PEPE_PROMPT for EnvStorage); otherwise it is kept in config.json.
+        if isinstance(self.backend, FileStorage) or "PROMPT" in self._data:
+            self._prompt_storage, self._prompt_data = self.backend, self._data
+        else:
+            self._prompt_storage = self._prompt_data = None
+        self._dirty = False
+        self._prompt_dirty = False
+        self._save_timer = None
+        self._save_lock = threading.Lock()  # keeps saves in order
+        atexit.register(self.flush)
         self._initialized = True
 
     def get(self, key, default=None):
         return self._data.get(key, default)
 
     def set(self, key, value):
-        self._data[key] = value
-        self.backend.save(self._data)
+        with self._data_lock:
+            if key in self._data and self._data[key] == value:
+                return
+            self._data[key] = value
+            self._dirty = True
+            self._schedule_save()
+        self._notify(key, value)
+
+    def subscribe(self, key, callback):
+        """Call ``callback(key, value)`` after each change of ``key``."""
+        with self._data_lock:
+            self._subscribers.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, key, callback):
+        with self._data_lock:
+            callbacks = self._subscribers.get(key, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
 
     def get_api_key(self):
-        return self.backend.get_secret("API_KEY")
+        key = self._secrets.get("API_KEY")
+        if key is None:
+            key = self.backend.get_secret("API_KEY")
+            if key:
+                self._secrets["API_KEY"] = key
+        return key
 
     def set_api_key(self, key):
         self.backend.set_secret("API_KEY", key)
+        self._secrets["API_KEY"] = key
+        if getattr(self.backend, "SECRETS_IN_FILE", False):
+            # Stored in the config file itself; keep later saves from dropping it.
+            with self._data_lock:
+                self._data["API_KEY"] = key
+
+    def invalidate_secrets(self):
+        """Forget looked-up secrets (e.g. after changing them elsewhere)."""
+        self._secrets.clear()
 
     def get_prompt(self, default=None):
-        storage = FileStorage()
-        data = storage.load()
-        prompt = data.get("PROMPT")
+        with self._data_lock:
+            prompt = self._load_prompt_data().get("PROMPT")
         return prompt if prompt is not None else default
 
     def set_prompt(self, prompt):
-        storage = FileStorage()
-        data = storage.load()
-        data["PROMPT"] = prompt
-        storage.save(data)
+        with self._data_lock:
+            data = self._load_prompt_data()
+            if data.get("PROMPT") == prompt:
+                return
+            data["PROMPT"] = prompt
+            self._prompt_dirty = True
+            self._schedule_save()
+        self._notify("PROMPT", prompt)
 
     def all(self):
         return dict(self._data)
+
+    def flush(self):
+        """Save pending changes now."""
+        with self._save_lock:
+            with self._data_lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if self._prompt_storage is self.backend:
+                    self._dirty |= self._prompt_dirty
+                    self._prompt_dirty = False
+                data = dict(self._data) if self._dirty else None
+                prompt_data = dict(self._prompt_data) if self._prompt_dirty else None
+                self._dirty = self._prompt_dirty = False
+            try:
+                if data is not None:
+                    self.backend.save(data)
+                if prompt_data is not None:
+                    self._prompt_storage.save(prompt_data)
+            except Exception as e:
+                logger.error(f"❌ Could not save settings: {e}")
+
+    def _load_prompt_data(self):
+        if self._prompt_data is None:
+            self._prompt_storage = FileStorage()
+            self._prompt_data = self._prompt_storage.load()
+        return self._prompt_data
+
+    def _schedule_save(self):
+        # Called with _data_lock held.
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _notify(self, key, value):
+        with self._data_lock:
+            callbacks = list(self._subscribers.get(key, ()))
+        for callback in callbacks:
+            try:
+                callback(key, value)
+            except Exception as e:
+                logger.error(f"❌ Config listener for {key} failed: {e}")
@@ -0,0 +1,73 @@
+import re
+import time
+
+from core import realtime_codec
+
+
+class EventRouter:
+    """Dispatch raw realtime frames to async handlers by event type.
+
+    Only frames with a registered handler are parsed: the type of every other
+    frame is read straight from the raw JSON text, and the frame is counted
+    and dropped. Per event type the router counts frames and accumulates
+    handler time (see ``stats()``).
+
+    Handlers are called as ``await handler(msg, *args)``; whatever they return
+    is passed back to the caller of ``dispatch()``.
+    """
+
+    # Server events normally open with their top-level "type". Only that
+    # position is trusted; any other frame is parsed to find its type.
+    _TYPE = re.compile(r'\{\s*"type"\s*:\s*"([^"]+)"')
+
+    def __init__(self, handlers=None):
+        self.handlers = dict(handlers or {})
+        self._stats = {}  # type -> [count, handler seconds, max handler seconds]
+
+    def on(self, event_type, handler):
+        self.handlers[event_type] = handler
+
+    async def dispatch(self, raw, *args):
+        match = self._TYPE.match(raw)
+        if match is not None and match.group(1) not in self.handlers:
+            self._count(match.group(1), 0.0)
+            return None
+
+        msg = realtime_codec.loads(raw)
+        event_type = msg.get("type")
+        handler = self.handlers.get(event_type)
+        if handler is None:
+            self._count(event_type, 0.0)
+            return None
+
+        start = time.perf_counter()
+        try:
+            return await handler(msg, *args)
+        finally:
+            self._count(event_type, time.perf_counter() - start)
+
+    def _count(self, event_type, seconds):
+        entry = self._stats.get(event_type)
+        if entry is None:
+            self._stats[event_type] = [1, seconds, seconds]
+            return
+        entry[0] += 1
+        entry[1] += seconds
+        if seconds > entry[2]:
+            entry[2] = seconds
+
+    def stats(self):
+        """``{type: {"count", "total_ms", "max_ms"}}``, busiest type first."""
+        return {
+            event_type: {
+                "count": count,
+                "total_ms": total * 1000,
+                "max_ms": peak * 1000,
+            }
+            for event_type, (count, total, peak) in sorted(
+                self._stats.items(), key=lambda item: -item[1][0]
+            )
+        }
+
+    def reset_stats(self):
+        self._stats.clear()
@@ -0,0 +1,223 @@
+import asyncio
+import struct
+import time
+from pathlib import Path
+
+import numpy as np
+
+from core.noise_suppression import PCM_LIMIT, AmplitudeGate, SpectralGate
+
+# WAVE_FORMAT_* tags understood by FileAudioSource.
+WAVE_PCM = 1
+WAVE_FLOAT = 3
+WAVE_EXTENSIBLE = 0xFFFE
+
+
+class FileAudioSource:
+    """Recorded audio as a RealtimeAPIClient audio source.
+
+    Stands in for AudioStreamManager (same consumer interface) over a WAV
+    file or headerless little-endian 16-bit PCM (``.raw``/``.pcm``). The file
+    is memory mapped, never read whole. 16 kHz mono 16-bit audio is handed
+    out as zero-copy views of the map; anything else (more channels, another
+    rate, 32-bit int or float samples) is downmixed and resampled block by
+    block (low-pass filtered first when downsampling, so content above
+    8 kHz does not alias into the speech band).
+
+    There is no real-time pacing: ``read_blocks()`` returns the next block
+    immediately and keeps the consumer awake until the file is exhausted, so
+    audio goes out as fast as the socket accepts it. Blocks are handed out
+    one at a time so the VAD closes utterances on the same block boundaries
+    as with live capture.
+    """
+
+    def __init__(
+        self,
+        path,
+        raw_samplerate=16000,
+        raw_channels=1,
+        noise_reduction=None,
+    ):
+        self.path = Path(path)
+        self.samplerate = 16000
+        self.blocksize = 16000 * 100 // 1000
+        self.min_volume_for_speech = 5
+        self.pre_roll_ms = 300
+        self.post_roll_ms = 200
+        self.overruns = 0
+
+        if self.path.suffix.lower() in (".raw", ".pcm"):
+            dtype, channels, rate, offset = "<i2", raw_channels, raw_samplerate, 0
+            size = self.path.stat().st_size
+        else:
+            dtype, channels, rate, offset, size = read_wav_header(self.path)
+        self.channels = channels
+        self.source_samplerate = rate
+
+        itemsize = np.dtype(dtype).itemsize
+        frames = size // (itemsize * channels)
+        if frames == 0:
+            raise ValueError(f"{self.path}: no audio")
+        self._data = np.memmap(
+            self.path, dtype=dtype, mode="r", offset=offset, shape=(frames * channels,)
+        )
+        self.source_frames = frames
+        self._lowpass = (
+            lowpass_taps(rate / self.samplerate) if rate > self.samplerate else None
+        )
+        self.total_frames = frames * self.samplerate // rate
+        self.total_blocks = -(-self.total_frames // self.blocksize)
+        self._zero_copy = (
+            dtype == "<i2"
+            and channels == 1
+            and rate == self.samplerate
+            and noise_reduction is None
+        )
+        # Full scale of the file's samples in int16 units.
+        self._scale = {"<i2": 1.0, "<i4": 1 / 65536, "<f4": float(PCM_LIMIT)}[dtype]
+
+        self._noise_reducer = None
+        if noise_reduction == "gate":
+            self._noise_reducer = AmplitudeGate(self.blocksize)
+        elif noise_reduction == "spectral":
+            self._noise_reducer = SpectralGate(self.blocksize)
+        elif noise_reduction is not None:
+            raise ValueError(f"Unknown noise reduction: {noise_reduction}")
+
+        self._read_index = 0
+        self._wakeup = None
+
+    @property
+    def duration(self):
+        return self.total_frames / self.samplerate
+
+    @property
+    def exhausted(self):
+        return self._read_index >= self.total_blocks
+
+    def progress(self):
+        return self._read_index / self.total_blocks if self.total_blocks else 1.0
+
+    def attach_consumer(self, loop, resume=False):
+        """Register the consumer; reading always continues where it stopped.
+
+        The returned event is set whenever there is a block left to read.
+        """
+        event = asyncio.Event()
+        if not self.exhausted:
+            event.set()
+        self._wakeup = event
+        return event
+
+    def detach_consumer(self):
+        self._wakeup = None
+
+    def read_blocks(self):
+        """Return the next ``(pcm, volume, captured_at)`` block (none at the end)."""
+        if self.exhausted:
+            return []
+        index = self._read_index
+        self._read_index += 1
+        start = index * self.blocksize
+        end = min(start + self.blocksize, self.total_frames)
+        if self._zero_copy:
+            pcm = self._data[start:end]
+        else:
+            pcm = self._convert(start, end)
+        volume = float(np.abs(pcm, dtype=np.float32).mean()) if len(pcm) else 0.0
+        if self._wakeup is not None and not self.exhausted:
+            self._wakeup.set()
+        return [(memoryview(pcm).cast("B"), volume, time.time())]
+
+    def latest_volume(self):
+        return 0.0
+
+    def _convert(self, start, end):
+        """Frames ``start:end`` at 16 kHz mono as int16, from any source format."""
+        channels = self.channels
+        ratio = self.source_samplerate / self.samplerate
+        first = int(start * ratio)
+        last = min(int(np.ceil((end - 1) * ratio)) + 1, self.source_frames)
+        # The filter needs ``pad`` frames of context on each side (zeros
+        # past the ends of the file).
+        pad = len(self._lowpass) // 2 if self._lowpass is not None else 0
+        lo, hi = max(first - pad, 0), min(last + pad, self.source_frames)
+        source = self._data[lo * channels : hi * channels]
+        samples = source.reshape(-1, channels).astype(np.float32)
+        samples = samples.mean(axis=1) if channels > 1 else samples[:, 0]
+        samples *= self._scale
+        if pad:
+            samples = np.pad(samples, (pad - (first - lo), pad - (hi - last)))
+            samples = np.convolve(samples, self._lowpass, mode="valid")
+
+        if ratio != 1:
+            positions = np.arange(start, end) * ratio - first
+            samples = np.interp(positions, np.arange(len(samples)), samples).astype(
+                np.float32
+            )
+        samples = samples[: end - start]
+
+        out = np.empty(len(samples), dtype=np.int16)
+        if self._noise_reducer is not None:
+            return self._noise_reducer.process(samples, out)
+        np.clip(samples, -PCM_LIMIT, PCM_LIMIT, out=samples)
+        np.copyto(out, samples, casting="unsafe")
+        return out
+
+
+def lowpass_taps(ratio, beta=8.6):
+    """FIR low-pass for downsampling by ``ratio`` (source rate / target rate).
+
+    Kaiser-windowed sinc with its cutoff at 90% of the target Nyquist
+    frequency; the stopband is about 85 dB down.
+    """
+    half = int(np.ceil(48 * ratio))
+    n = np.arange(-half, half + 1)
+    cutoff = 0.45 / ratio  # cycles per source sample
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(2 * half + 1, beta)
+    return (taps / taps.sum()).astype(np.float32)
+
+
+def read_wav_header(path):
+    """Locate the samples of a WAV file.
+
+    Returns ``(dtype, channels, samplerate, data_offset, data_size)``.
+    """
+    with open(path, "rb") as f:
+        riff, _, wave = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or wave != b"WAVE":
+            raise ValueError(f"{path}: not a WAV file")
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"{path}: no data chunk")
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                body = f.read(size)
+                tag, channels, rate, _, _, bits = struct.unpack("<HHIIHH", body[:16])
+                if tag == WAVE_EXTENSIBLE and len(body) >= 26:
+                    tag = struct.unpack("<H", body[24:26])[0]
+                fmt = tag, channels, rate, bits
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError(f"{path}: data chunk before fmt chunk")
+                offset = f.tell()
+                # Streamed WAVs may leave the size at 0 or 0xFFFFFFFF.
+                available = Path(path).stat().st_size - offset
+                size = available if size in (0, 0xFFFFFFFF) else min(size, available)
+                break
+            else:
+                f.seek(size, 1)
+            if size % 2:
+                f.seek(1, 1)
+
+    tag, channels, rate, bits = fmt
+    dtype = {
+        (WAVE_PCM, 16): "<i2",
+        (WAVE_PCM, 32): "<i4",
+        (WAVE_FLOAT, 32): "<f4",
+    }.get((tag, bits))
+    if dtype is None:
+        raise ValueError(f"{path}: unsupported WAV format (tag={tag}, bits={bits})")
+    return dtype, channels, rate, offset, size
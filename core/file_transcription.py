@@ -0,0 +1,149 @@
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from core.config_manager import ConfigManager
+from core.file_audio_source import FileAudioSource
+from core.message_types import UIMessageType
+from core.realtime_api_manager import RealtimeAPIClient
+from core.translation_cache import TranslationCache
+from core.log_manager import get_logger
+
+logger = get_logger("file")
+
+
+class TranscriptWriter:
+    """ui_queue of a file client: writes its captions and translations.
+
+    Captions and translations carry their translation seq; each caption is
+    written together with its translation, in transcript order. Captions
+    whose translation failed are written on their own.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self.captions = {}  # seq -> caption waiting for its translation
+        self.utterances = 0
+
+    def put(self, msg):
+        seq = msg.get("seq")
+        if msg["type"] == UIMessageType.CAPTION:
+            if seq is None:
+                self._write(msg["text"], None)
+            else:
+                self.captions[seq] = msg["text"]
+        elif msg["type"] == UIMessageType.TRANSLATED:
+            # Translations arrive in seq order: earlier captions have none.
+            for earlier in sorted(s for s in self.captions if s < seq):
+                self._write(self.captions.pop(earlier), None)
+            self._write(self.captions.pop(seq, ""), msg["text"])
+
+    def close(self):
+        for seq in sorted(self.captions):
+            self._write(self.captions[seq], None)
+        self.captions.clear()
+        self._file.close()
+
+    def _write(self, caption, translation):
+        self.utterances += 1
+        lines = [caption] if caption else []
+        if translation:
+            lines.append(f"→ {translation}")
+        self._file.write("\n".join(lines) + "\n\n")
+        self._file.flush()
+
+
+async def transcribe_file(path, output_path, translation_cache=None, **source_options):
+    """Transcribe and translate one audio file into ``output_path``.
+
+    Audio is streamed without real-time pacing; once it is all sent the
+    client waits for the outstanding transcripts and translations, then
+    stops. Returns ``(utterances, audio seconds, wall seconds)``.
+    """
+    source = FileAudioSource(path, **source_options)
+    writer = TranscriptWriter(output_path)
+    client = RealtimeAPIClient(audio_source=source)
+    client.ui_queue = writer
+    # Stay well inside the replay buffer so a reconnect loses nothing.
+    client.max_untranscribed_seconds = 20
+    if translation_cache is not None:
+        client.translation_cache = translation_cache
+
+    started = time.perf_counter()
+    task = asyncio.create_task(client.run())
+    try:
+        await asyncio.sleep(0)  # let run() start the client
+        if not await client.drain():
+            logger.warning(f"⌛ {path}: gave up waiting for translations")
+    finally:
+        client.stop()
+        await task
+        writer.close()
+    return writer.utterances, source.duration, time.perf_counter() - started
+
+
+async def transcribe_files(paths, output_dir=None, parallel=2, **source_options):
+    """Transcribe several files, at most ``parallel`` at a time.
+
+    Each ``<name>.<ext>`` is written to ``<name>.txt`` in ``output_dir``
+    (default: next to the input).
+    """
+    limit = asyncio.Semaphore(max(1, parallel))
+    # One cache for all files, so repeated phrases are translated once.
+    cache = TranslationCache(
+        persistent=ConfigManager().get("TRANSLATION_CACHE_PERSIST", False)
+    )
+
+    async def one(path):
+        path = Path(path)
+        output = Path(output_dir or path.parent) / f"{path.stem}.txt"
+        async with limit:
+            try:
+                utterances, audio_seconds, seconds = await transcribe_file(
+                    path, output, translation_cache=cache, **source_options
+                )
+            except Exception as e:
+                logger.error(f"❌ {path}: {e}")
+                return False
+        logger.info(
+            f"📝 {path} -> {output}: {utterances} utterances, "
+            f"{audio_seconds:.0f}s audio in {seconds:.0f}s "
+            f"({audio_seconds / max(seconds, 1e-6):.1f}x realtime)"
+        )
+        return True
+
+    results = await asyncio.gather(*(one(path) for path in paths))
+    return all(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Transcribe and translate recorded audio files."
+    )
+    parser.add_argument("files", nargs="+", help="WAV or raw 16-bit PCM files")
+    parser.add_argument("-o", "--output-dir", help="default: next to each input")
+    parser.add_argument(
+        "-j",
+        "--parallel",
+        type=int,
+        default=ConfigManager().get("FILE_PARALLELISM", 2),
+        help="files processed at once",
+    )
+    parser.add_argument("--raw-samplerate", type=int, default=16000)
+    parser.add_argument("--raw-channels", type=int, default=1)
+    parser.add_argument("--noise-reduction", choices=["gate", "spectral"])
+    args = parser.parse_args(argv)
+
+    return asyncio.run(
+        transcribe_files(
+            args.files,
+            output_dir=args.output_dir,
+            parallel=args.parallel,
+            raw_samplerate=args.raw_samplerate,
+            raw_channels=args.raw_channels,
+            noise_reduction=args.noise_reduction,
+        )
+    )
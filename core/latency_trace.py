@@ -0,0 +1,129 @@
+import time
+from collections import deque
+
+import numpy as np
+from core.log_manager import JsonLinesWriter, get_logger
+
+logger = get_logger("latency")
+
+# Pipeline stages in their usual order. With speculative translation the
+# response stages can come before "transcribed".
+STAGES = (
+    "captured",  # first loud frame of the utterance left the microphone
+    "appended",  # first input_audio_buffer.append written
+    "commit_sent",
+    "committed",  # input_audio_buffer.committed received
+    "transcribed",  # transcription completed
+    "response_sent",  # response.create queued for the translation
+    "first_delta",
+    "response_done",
+    "shown",  # TRANSLATED handed to the UI (in transcript order)
+)
+
+
+class LatencyTracer:
+    """Per-utterance timestamps from first captured frame to shown translation.
+
+    A trace is a plain dict of stage -> ``time.time()``; only the first mark
+    of each stage counts. Traces are bound to their translation seq once the
+    utterance is committed. Finished traces are appended to ``path`` as JSONL
+    (stage offsets from "captured" and durations between consecutive stages,
+    in ms) by a background writer, rotated like app.log, and the last
+    ``window`` of them feed ``percentiles()``.
+    """
+
+    def __init__(self, path=None, window=200):
+        self.path = path
+        self._writer = None
+        self._by_seq = {}
+        self._totals = deque(maxlen=window)
+        self._durations = {}
+
+    @staticmethod
+    def begin(captured_at=None):
+        return {"captured": captured_at or time.time()}
+
+    @staticmethod
+    def mark(trace, stage, at=None):
+        if trace is not None and stage not in trace:
+            trace[stage] = at or time.time()
+
+    def bind(self, seq, trace):
+        if trace is not None:
+            self._by_seq[seq] = trace
+
+    def mark_seq(self, seq, stage):
+        self.mark(self._by_seq.get(seq), stage)
+
+    def finish(self, seq, shown=True):
+        """Close the trace of ``seq``; returns its record (None if untraced)."""
+        trace = self._by_seq.pop(seq, None)
+        if trace is None:
+            return None
+        if shown:
+            self.mark(trace, "shown")
+
+        start = trace["captured"]
+        offsets = {
+            stage: round((trace[stage] - start) * 1000, 1)
+            for stage in STAGES
+            if stage in trace
+        }
+        present = [stage for stage in STAGES if stage in trace]
+        durations = {
+            f"{a}->{b}": round((trace[b] - trace[a]) * 1000, 1)
+            for a, b in zip(present, present[1:])
+        }
+        record = {
+            "seq": seq,
+            "captured_at": start,
+            "shown": shown,
+            "offsets_ms": offsets,
+            "durations_ms": durations,
+        }
+
+        if shown:
+            self._totals.append(offsets["shown"])
+            for name, ms in durations.items():
+                self._durations.setdefault(
+                    name, deque(maxlen=self._totals.maxlen)
+                ).append(ms)
+        self._write(record)
+        return record
+
+    def percentiles(self):
+        """``{name: (p50_ms, p95_ms, n)}`` for the total and each stage step."""
+        series = {"total": self._totals, **self._durations}
+        return {
+            name: (
+                float(np.percentile(values, 50)),
+                float(np.percentile(values, 95)),
+                len(values),
+            )
+            for name, values in series.items()
+            if values
+        }
+
+    def summary(self):
+        """One-line p50/p95 of speech-to-translation latency."""
+        if not self._totals:
+            return ""
+        p50, p95 = np.percentile(self._totals, (50, 95))
+        n = len(self._totals)
+        return f"⏱ Latency p50 {p50 / 1000:.2f}s / p95 {p95 / 1000:.2f}s (n={n})"
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _write(self, record):
+        if self.path is None:
+            return
+        try:
+            if self._writer is None:
+                self._writer = JsonLinesWriter(self.path)
+            self._writer.write(record)
+        except Exception as e:
+            logger.warning(f"⚠️ Latency trace disabled: {e}")
+            self.path = None
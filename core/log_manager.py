@@ -1,20 +1,169 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import sys
 from pathlib import Path
 
+LOG_DIR = Path.home() / "Library" / "Logs" / "PepeTranslator"
+
+# Environment overrides (levels are names like DEBUG or WARNING):
+#   PEPE_LOG_LEVEL                overall level (default INFO)
+#   PEPE_LOG_LEVEL_<SUBSYSTEM>    e.g. PEPE_LOG_LEVEL_REALTIME=DEBUG
+#   PEPE_LOG_FORMAT               "text" (default) or "json" (one object per line)
+#   PEPE_LOG_ROTATE               "size" (default) or "midnight"
+#   PEPE_LOG_MAX_BYTES            size rotation threshold (default 5 MB)
+#   PEPE_LOG_BACKUPS              rotated files kept (default 5)
+ENV_PREFIX = "PEPE_LOG_"
+SUBSYSTEMS = ("audio", "realtime", "translation", "latency", "file", "ui", "config")
+
+_listener = None
+
+
+def get_logger(subsystem):
+    """Logger of one subsystem (``pepe.<subsystem>``), levelled separately."""
+    return logging.getLogger(f"pepe.{subsystem}")
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        ui_type = getattr(record, "ui_type", None)
+        if ui_type is not None:
+            entry["ui_type"] = ui_type
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting, tracebacks included, to the listener.
+
+    The stock prepare() formats the record (and merges the traceback into the
+    message) on the caller's thread; here only the message arguments are
+    resolved, as they may change after the call.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
 def setup_logging():
-    log_dir = Path.home() / "Library" / "Logs" / "PepeTranslator"
+    """Log to LOG_DIR/app.log (rotated) and stderr without blocking callers.
+
+    Callers only resolve the message text and put the record on a queue; a
+    background listener thread does the formatting and disk I/O.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_dir = LOG_DIR
     log_dir.mkdir(parents=True, exist_ok=True)
 
     log_file = log_dir / "app.log"
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler(),
-        ],
+    env = os.environ
+    handlers = [_rotating_handler(log_file), logging.StreamHandler(sys.stderr)]
+
+    if env.get(ENV_PREFIX + "FORMAT", "text") == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel(_level(env.get(ENV_PREFIX + "LEVEL"), logging.INFO))
+    for subsystem in SUBSYSTEMS:
+        level = env.get(f"{ENV_PREFIX}LEVEL_{subsystem.upper()}")
+        if level:
+            get_logger(subsystem).setLevel(_level(level, logging.NOTSET))
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
     )
+    _listener.start()
+    atexit.register(shutdown_logging)
 
     logging.info("Logging initialized")
+
+
+class JsonLinesWriter:
+    """Appends JSON objects to a file, one per line, off the caller's thread.
+
+    ``write()`` only enqueues the object; a listener thread encodes it and
+    writes it to ``path``, which rotates like app.log (PEPE_LOG_* settings).
+    """
+
+    def __init__(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handler = _rotating_handler(path, delay=True)
+        self._handler.setFormatter(_JsonLineFormatter())
+        self._queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(self._queue, self._handler)
+        self._listener.start()
+
+    def write(self, obj):
+        self._queue.put(logging.makeLogRecord({"msg": obj}))
+
+    def close(self):
+        """Write out what is queued and close the file."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            self._handler.close()
+
+
+class _JsonLineFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps(record.msg, ensure_ascii=False)
+
+
+def _rotating_handler(path, delay=False):
+    env = os.environ
+    if env.get(ENV_PREFIX + "ROTATE", "size") == "midnight":
+        return logging.handlers.TimedRotatingFileHandler(
+            path,
+            when="midnight",
+            backupCount=int(env.get(ENV_PREFIX + "BACKUPS", 5)),
+            encoding="utf-8",
+            delay=delay,
+        )
+    return logging.handlers.RotatingFileHandler(
+        path,
+        maxBytes=int(env.get(ENV_PREFIX + "MAX_BYTES", 5 * 1024 * 1024)),
+        backupCount=int(env.get(ENV_PREFIX + "BACKUPS", 5)),
+        encoding="utf-8",
+        delay=delay,
+    )
+
+
+def shutdown_logging():
+    """Write out queued records and stop the writer (call before os._exit)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _level(name, default):
+    if not name:
+        return default
+    level = logging.getLevelName(name.strip().upper())
+    return level if isinstance(level, int) else default
@@ -1,35 +1,55 @@
-from enum import Enum
 import logging
+from enum import Enum
+from core.log_manager import get_logger
 
 
 class UIMessageType(Enum):
     SYS_LOG = "sys_log"
     LOG = "log"
     CAPTION = "caption"
+    CAPTION_PARTIAL = "caption_partial"
     TRANSLATED = "translated"
+    TRANSLATED_PARTIAL = "translated_partial"
+    LATENCY = "latency"
     VOLUME = "volume"
     AUDIO_STARTED = "audio_started"
     AUDIO_STOPPED = "audio_stopped"
 
 
+# Streaming partials repeat the whole text so far on every delta; mirrored at
+# INFO they would grow the log with the square of the utterance length.
+DEBUG_LOGGED = {UIMessageType.CAPTION_PARTIAL, UIMessageType.TRANSLATED_PARTIAL}
+
+
 class UIMessageMixin:
     ui_queue = None
+    # Logger (and level override) the messages are mirrored to.
+    log_subsystem = "ui"
 
     @classmethod
     def set_ui_queue(cls, queue):
         cls.ui_queue = queue
 
-    def ui_msg(self, msg_type: UIMessageType, text: str):
+    def ui_msg(self, msg_type: UIMessageType, text: str, **fields):
+        # ``fields`` ride along in the queued message (e.g. the translation
+        # seq of captions and translations).
         # Mirror messages to logger so status is visible outside the Tk UI.
         try:
             if msg_type != UIMessageType.VOLUME:
-                logging.info("[%s] %s", msg_type.value, text)
+                level = logging.DEBUG if msg_type in DEBUG_LOGGED else logging.INFO
+                get_logger(self.log_subsystem).log(
+                    level,
+                    "[%s] %s",
+                    msg_type.value,
+                    text,
+                    extra={"ui_type": msg_type.value},
+                )
         except Exception:
             pass
 
         if self.ui_queue:
             try:
-                self.ui_queue.put({"type": msg_type, "text": text})
+                self.ui_queue.put({"type": msg_type, "text": text, **fields})
             except Exception:
                 pass
         else:
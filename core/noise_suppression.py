@@ -0,0 +1,185 @@
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+# Keep int16 conversion symmetric; -32768 would overflow np.abs on int16.
+PCM_LIMIT = 32767
+
+
+class AmplitudeGate:
+    """Per-sample gate against a slowly tracked mean-amplitude noise floor.
+
+    Samples well above the floor pass through, quieter ones are attenuated
+    proportionally. All intermediates live in buffers allocated up front.
+    """
+
+    def __init__(self, blocksize, smoothing=0.95, ratio=1.5):
+        self.smoothing = smoothing
+        self.ratio = ratio
+        self.noise_floor = None
+        self._abs = np.empty(blocksize, dtype=np.float32)
+        self._scale = np.empty(blocksize, dtype=np.float32)
+
+    def process(self, samples, out):
+        """Gate float32 ``samples`` (int16 scale) into int16 ``out``."""
+        n = len(samples)
+        magnitude = np.abs(samples, out=self._abs[:n])
+        level = float(magnitude.mean())
+
+        if self.noise_floor is None:
+            self.noise_floor = level
+        # Update the noise floor slowly using the smoothing factor.
+        self.noise_floor = max(
+            self.smoothing * self.noise_floor + (1 - self.smoothing) * level, 1e-6
+        )
+
+        # Suppress sounds below the noise floor.
+        scale = np.multiply(
+            magnitude, 1.0 / (self.noise_floor * self.ratio), out=self._scale[:n]
+        )
+        np.clip(scale, 0.0, 1.0, out=scale)
+        np.multiply(samples, scale, out=scale)
+        np.clip(scale, -PCM_LIMIT, PCM_LIMIT, out=scale)
+        np.copyto(out, scale, casting="unsafe")
+        return out
+
+
+class SpectralGate:
+    """STFT spectral gating with a tracked per-bin noise profile.
+
+    Each block is cut into frames of ``2 * hop`` samples at 50% overlap with a
+    sqrt-Hann analysis/synthesis window pair, so unmodified frames overlap-add
+    back to the input exactly. Every bin gets a gain of
+    ``1 - threshold * noise / magnitude`` (floored at ``floor``). The noise
+    profile follows the per-block mean magnitude of each bin, but only over
+    noise-like blocks: those whose power spectrum is flat (spectral flatness
+    at least ``min_flatness``, as in EnergySpectralVAD). Voiced speech and
+    tones are never learned, and until a noise-like block has been seen the
+    profile is zero and audio passes unchanged.
+
+    The whole block is processed as one 2-D array; FFTs write into
+    preallocated ``out=`` buffers. Output lags the input by ``hop`` samples.
+    """
+
+    def __init__(
+        self,
+        blocksize,
+        hop=200,
+        threshold=1.5,
+        floor=0.1,
+        noise_rise=0.1,
+        noise_fall=0.5,
+        min_flatness=0.4,
+    ):
+        if blocksize % hop:
+            raise ValueError(f"blocksize {blocksize} is not a multiple of hop {hop}")
+
+        self.blocksize = blocksize
+        self.hop = hop
+        self.threshold = threshold
+        self.floor = floor
+        self.noise_rise = noise_rise
+        self.noise_fall = noise_fall
+        self.min_flatness = min_flatness
+
+        frame = 2 * hop
+        frames = blocksize // hop
+        bins = hop + 1
+        f32 = np.float32
+
+        # Periodic Hann split into sqrt halves: analysis * synthesis sums to 1.
+        n = np.arange(frame)
+        self._window = np.sqrt(0.5 - 0.5 * np.cos(2 * np.pi * n / frame)).astype(f32)
+
+        # [previous hop samples | current block]; frames are strided views.
+        self._input = np.zeros(blocksize + hop, dtype=f32)
+        itemsize = self._input.itemsize
+        self._framed = as_strided(
+            self._input,
+            shape=(frames, frame),
+            strides=(hop * itemsize, itemsize),
+            writeable=False,
+        )
+        self._windowed = np.empty((frames, frame), dtype=f32)
+        self._spectrum = np.empty((frames, bins), dtype=np.complex64)
+        self._magnitude = np.empty((frames, bins), dtype=f32)
+        self._gain = np.empty((frames, bins), dtype=f32)
+        self._synth = np.empty((frames, frame), dtype=f32)
+
+        self._noise = np.zeros(bins, dtype=f32)
+        self._noise_ready = False
+        self._block_level = np.empty(bins, dtype=f32)
+        self._block_power = np.empty(bins, dtype=f32)
+        self._rate = np.empty(bins, dtype=f32)
+        self._falling = np.empty(bins, dtype=bool)
+        self._noise_scaled = np.empty(bins, dtype=f32)
+
+        # Overlap-add views: out[i] = synth[i, :hop] + synth[i - 1, hop:].
+        self._output = np.zeros(blocksize, dtype=f32)
+        self._out_frames = self._output.reshape(frames, hop)
+        self._tail = np.zeros(hop, dtype=f32)
+
+    def reset(self):
+        self._input.fill(0)
+        self._tail.fill(0)
+        self._noise.fill(0)
+        self._noise_ready = False
+
+    def process(self, samples, out):
+        """Denoise float32 ``samples`` (int16 scale) into int16 ``out``."""
+        n = len(samples)
+        hop = self.hop
+        self._input[hop : hop + n] = samples
+        if n < self.blocksize:
+            self._input[hop + n :] = 0
+
+        np.multiply(self._framed, self._window, out=self._windowed)
+        np.fft.rfft(self._windowed, axis=-1, out=self._spectrum)
+        np.abs(self._spectrum, out=self._magnitude)
+        self._update_noise_profile()
+
+        gain = self._gain
+        np.multiply(self._noise, self.threshold, out=self._noise_scaled)
+        np.add(self._magnitude, 1e-6, out=gain)
+        np.divide(self._noise_scaled, gain, out=gain)
+        np.subtract(1.0, gain, out=gain)
+        np.clip(gain, self.floor, 1.0, out=gain)
+        np.multiply(self._spectrum, gain, out=self._spectrum)
+
+        synth = self._synth
+        np.fft.irfft(self._spectrum, n=2 * hop, axis=-1, out=synth)
+        np.multiply(synth, self._window, out=synth)
+
+        out_frames = self._out_frames
+        np.copyto(out_frames, synth[:, :hop])
+        np.add(out_frames[1:], synth[:-1, hop:], out=out_frames[1:])
+        np.add(out_frames[0], self._tail, out=out_frames[0])
+        np.copyto(self._tail, synth[-1, hop:])
+        np.copyto(self._input[:hop], self._input[self.blocksize :])
+
+        output = self._output[:n]
+        np.clip(output, -PCM_LIMIT, PCM_LIMIT, out=output)
+        np.copyto(out, output, casting="unsafe")
+        return out
+
+    def _update_noise_profile(self):
+        block_level = np.mean(self._magnitude, axis=0, out=self._block_level)
+        if self._flatness(block_level) < self.min_flatness:
+            return  # speech or a tone: keep it out of the profile
+        if not self._noise_ready:
+            np.copyto(self._noise, block_level)
+            self._noise_ready = True
+            return
+
+        # noise += rate * (level - noise), with a faster rate downwards.
+        np.subtract(block_level, self._noise, out=block_level)
+        np.less(block_level, 0, out=self._falling)
+        self._rate.fill(self.noise_rise)
+        np.copyto(self._rate, self.noise_fall, where=self._falling)
+        np.multiply(block_level, self._rate, out=block_level)
+        np.add(self._noise, block_level, out=self._noise)
+
+    def _flatness(self, block_level):
+        # Geometric / arithmetic mean of the power, DC bin excluded.
+        power = np.multiply(block_level, block_level, out=self._block_power)[1:]
+        power += 1e-6
+        return float(np.exp(np.log(power).mean()) / power.mean())
@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import signal
+import sys
+import time
+
+from core import realtime_codec
+from core.audio_manager import AudioStreamManager
+from core.config_manager import ConfigManager
+from core.message_types import UIMessageType
+from core.realtime_api_manager import RealtimeAPIClient
+
+DEFAULT_EVENTS = ("caption", "translated")
+
+
+class TranslationPipeline:
+    """Audio in, captions and translations out, without any UI.
+
+    ``events()`` runs the pipeline and yields its messages as plain dicts,
+    ``{"type": "caption", "text": ..., "ts": ..., "seq": ...}`` (``type`` is a
+    UIMessageType value, ``ts`` the time the message was produced)::
+
+        pipeline = TranslationPipeline()
+        async for event in pipeline.events():
+            ...
+
+    Without ``audio_source`` the microphone is captured; there is one
+    microphone client per process, but pipelines over other sources (see
+    FileAudioSource) are independent and can run side by side. The stream
+    ends after stop(), or once a finite source has been fully translated.
+    """
+
+    def __init__(self, audio_source=None, types=DEFAULT_EVENTS):
+        self.source = audio_source
+        # None = every message type.
+        self.types = {UIMessageType(t) for t in types} if types else None
+        self.client = RealtimeAPIClient(audio_source=audio_source)
+        self._loop = None
+        self._queue = None
+
+    async def events(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self.client.ui_queue = self
+        task = asyncio.create_task(self._run())
+        try:
+            while True:
+                event = await self._queue.get()
+                if event is None:
+                    break
+                yield event
+        finally:
+            self.stop()
+            await task
+
+    def stop(self):
+        """Stop the pipeline (safe from any thread or a signal handler)."""
+        if not self.client.stop_flag:
+            self.client.stop()
+
+    def put(self, msg):
+        # The client's ui_queue: called from the loop thread and, for the
+        # microphone, from whichever thread starts or stops it.
+        if self.types is not None and msg["type"] not in self.types:
+            return
+        event = {"type": msg["type"].value, "ts": time.time()}
+        event.update((k, v) for k, v in msg.items() if k != "type")
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
+
+    async def _run(self):
+        microphone = None
+        if self.source is None:
+            microphone = AudioStreamManager()
+            microphone.ui_queue = self
+            microphone.start()
+        try:
+            task = asyncio.ensure_future(self.client.run())
+            await asyncio.sleep(0)  # let run() start the client
+            if self.source is not None:
+                await self.client.drain()
+                self.client.stop()
+            await task
+        finally:
+            if microphone is not None:
+                microphone.stop()
+            # Queued behind every event produced so far.
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+
+
+async def stream_jsonl(pipeline, out):
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, pipeline.stop)
+        except (NotImplementedError, RuntimeError):
+            pass
+    async for event in pipeline.events():
+        out.write(realtime_codec.dumps(event) + "\n")
+        out.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stream captions and translations to stdout as JSON lines."
+    )
+    parser.add_argument(
+        "--file", help="translate a WAV/raw PCM file instead of the microphone"
+    )
+    parser.add_argument(
+        "--events",
+        default=",".join(DEFAULT_EVENTS),
+        help="comma-separated message types, or 'all' "
+        f"({', '.join(t.value for t in UIMessageType)})",
+    )
+    parser.add_argument(
+        "--keyring",
+        action="store_true",
+        help="read settings and the API key from the keychain "
+        "(default: OPENAI_API_KEY and PEPE_* environment variables)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.keyring:
+        from core.config_keyingstorage import KeyringStorage
+
+        ConfigManager.configure(KeyringStorage())
+    else:
+        from core.config_envstorage import EnvStorage
+
+        ConfigManager.configure(EnvStorage())
+
+    source = None
+    if args.file:
+        from core.file_audio_source import FileAudioSource
+
+        source = FileAudioSource(args.file)
+    types = None if args.events == "all" else args.events.split(",")
+    pipeline = TranslationPipeline(source, types=types)
+    asyncio.run(stream_jsonl(pipeline, sys.stdout))
@@ -1,16 +1,28 @@
 import asyncio
-import json
-import base64
-import websockets
+import os
 import time
 import threading
-import logging
-from queue import Empty
+import re
+from collections import OrderedDict, deque
 from core.config_manager import ConfigManager
 from core.audio_manager import AudioStreamManager
+from core.append_coalescer import AppendCoalescer
+from core.vad import EnergySpectralVAD, VADEvent
+from core.translation_cache import TranslationCache
+from core.realtime_connection import RealtimeConnection
+from core.replay_buffer import ReplayBuffer
+from core.event_router import EventRouter
+from core.latency_trace import LatencyTracer
+from core.log_manager import LOG_DIR, get_logger
+from core import realtime_codec
 from core.message_types import UIMessageType, UIMessageMixin
 
+logger = get_logger("realtime")
+translation_logger = get_logger("translation")
+
 WS_URL = "wss://api.openai.com/v1/realtime?model=gpt-realtime-mini"
+# Point the client elsewhere (e.g. benchmarks/mock_realtime_server.py).
+WS_URL_ENV = "REALTIME_WS_URL"
 
 DEFAULT_TRANSLATION_INSTRUCTIONS = (
     "You are a Japanese translator. Translate the latest user message into natural Japanese, and output only the Japanese translation. "
@@ -18,6 +30,37 @@ DEFAULT_TRANSLATION_INSTRUCTIONS = (
     "If the message is already in English, still translate it into Japanese. Always output only the translated Japanese sentence."
 )
 
+# Appended to the translation prompt in the translation session config, for
+# requests where several transcripts share one message.
+BATCH_TRANSLATION_INSTRUCTIONS = (
+    "If the message contains several independent segments, each starting with a marker such as [[1]], "
+    "translate every segment separately. Start each translation on a new line with the same marker. "
+    "Never merge, drop, reorder or renumber segments."
+)
+
+SEGMENT_MARKER = re.compile(r"\[\[(\d+)\]\]")
+SENTENCE_END = re.compile(r"[.!?。！？]\s*$")
+# Periods that end an abbreviation or a number ("Dr.", "3."), not a sentence.
+NOT_SENTENCE_END = re.compile(
+    r"(?:\b(?:mr|mrs|ms|dr|prof|st|jr|sr|vs|etc|no|e\.g|i\.e)|\b\d+)\.\s*$",
+    re.IGNORECASE,
+)
+
+TRANSCRIPTION_SESSION = {
+    "type": "realtime",
+    "output_modalities": ["text"],
+    "audio": {
+        "input": {
+            "turn_detection": None,
+            "transcription": {"model": "gpt-4o-mini-transcribe"},
+        }
+    },
+    "instructions": (
+        "Your only task is transcription. Output must contain only the raw spoken text with no explanations, no comments, no punctuation suggestions, and no metadata. Do not add anything else. "
+        "Output only plain text. Do not use JSON, quotes, code blocks, or any formatting."
+    ),
+}
+
 DEFAULT_TRANSCRIPTION_INSTRUCTIONS = (
     "Transcribe the latest committed user audio verbatim in the original spoken language. "
     "Do not translate, summarize, answer, continue the conversation, or add any commentary. "
@@ -27,23 +70,54 @@ DEFAULT_TRANSCRIPTION_INSTRUCTIONS = (
 
 class RealtimeAPIClient(UIMessageMixin):
     _instance = None
-
-    def __new__(cls):
+    log_subsystem = "realtime"
+
+    def __new__(cls, audio_source=None):
+        # The microphone client is shared; clients over another audio source
+        # (see FileAudioSource) are independent instances.
+        if audio_source is not None:
+            instance = super().__new__(cls)
+            UIMessageMixin.__init__(instance)
+            return instance
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             UIMessageMixin.__init__(cls._instance)
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, audio_source=None):
         if hasattr(self, "_initialized"):
             return
 
-        self.ws = None
+        # AudioStreamManager or anything with its consumer interface
+        # (attach_consumer / read_blocks / detach_consumer).
+        self.audio = audio_source or AudioStreamManager()
+        self.ws_url = os.environ.get(WS_URL_ENV) or WS_URL
+        self.ws = None  # transcription socket (audio in, transcripts out)
+        self.transcription = None
         self.loop = None
         self.main_task = None
         self.stop_flag = False
+        # Sessions can be opened before the mic starts (prewarm()); audio is
+        # only streamed while stream_audio is set.
+        self.stream_audio = False
+        self.streaming = None  # asyncio.Event mirroring stream_audio
+        self.streaming_requested_at = None  # for time-to-first-caption
+        self.streaming_warm = False
+        self.sending = False  # the sender is reading audio
         self._initialized = True
         self.commit_level = 10
+        # Utterance boundaries come from a local VAD (swap via set_vad()).
+        # The commit_level slider is its absolute energy threshold.
+        self.vad = EnergySpectralVAD(energy_threshold=self.commit_level)
+        self.min_commit_seconds = 0.3
+        self.max_utterance_seconds = 12.0
+        self.inactivity_commit_seconds = 0.8
+        # Appends are merged while the socket is backed up; see AppendCoalescer.
+        self.append_max_latency = 0.2
+        self.append_max_payload_bytes = 16000 * 2 * 2
+        # Sources faster than real time (files) stop being read while this
+        # much sent audio still waits for its transcript; None = no limit.
+        self.max_untranscribed_seconds = None
 
         # translation_queue:
         # -------------------------------------------------------------
@@ -55,13 +129,77 @@ class RealtimeAPIClient(UIMessageMixin):
         # This guarantees that *no translation is ever lost*.
         self.translation_queue = []
         self.translation_lock = asyncio.Lock()
-        self.response_lock = asyncio.Lock()
         self.buffered_audio_bytes = 0
+        # Audio without a transcript yet, replayed after a reconnect.
+        self.audio_replay = ReplayBuffer()
+        # Per-utterance stage timestamps (see LatencyTracer), written to
+        # latency.jsonl next to the app log.
+        self.latency = LatencyTracer(
+            path=(
+                LOG_DIR / "latency.jsonl"
+                if ConfigManager().get("LATENCY_TRACE", True)
+                else None
+            )
+        )
+        self._utterance_trace = None  # trace of the utterance being recorded
         self.pending_response_requests = []
-        self.response_in_flight = False
+
+        # Live captions: transcription deltas accumulated per item_id, and the
+        # items whose final caption was already shown (bounded, oldest dropped).
+        self.caption_parts = {}
+        self.captioned_items = OrderedDict()
+
+        # Speculative translation (off by default): once a transcript prefix
+        # ends a sentence or stops changing for speculation_stable_seconds, it
+        # is translated before transcription completes. The final transcript
+        # then reuses that translation, translates only the remainder (when
+        # the prefix was a whole sentence: translations of sentence fragments
+        # do not join), or retranslates everything.
+        self.speculative_translation = ConfigManager().get(
+            "SPECULATIVE_TRANSLATION", False
+        )
+        self.speculation_stable_seconds = 0.6
+        self.speculations = {}  # item_id -> speculation state
+        self.speculation_timers = {}  # item_id -> asyncio.TimerHandle
+        self.item_seqs = {}  # item_id -> seq reserved at commit
+        self.seq_reserved_at = {}  # seq -> time reserved
+        self.joins = {}  # seq -> [prefix translation, remainder translation]
+
+        # Concurrent translations with ordered delivery:
+        # -------------------------------------------------------------
+        # Each transcript gets a sequence number when it is queued. Up to
+        # max_concurrent_responses out-of-band responses run at once; each
+        # carries its seqs in response metadata. Finished translations wait in
+        # translation_results until every earlier seq is done, so TRANSLATED
+        # messages always follow transcript order.
+        self.max_concurrent_responses = 3
+        # Translations run on their own sessions so response traffic never
+        # queues behind (or ahead of) audio appends on the transcription
+        # socket. Requests go to the least busy translation connection.
+        self.translation_connections = ConfigManager().get("TRANSLATION_CONNECTIONS", 1)
+        self.translation_pool = []
+        self.translation_timeout = 30.0
+        self.inflight_requests = {}  # event_id -> request
+        self.response_requests = {}  # response_id -> request
+        self.translation_results = {}  # seq -> text ("" when failed)
+        self.next_translation_seq = 0
+        self.next_emit_seq = 0
+        self.response_counter = 0
+        # When requests back up, up to this many waiting transcripts are sent
+        # as one marked-up request (1 disables batching).
+        self.max_batch_segments = 4
         self.translation_prompt = ConfigManager().get_prompt(
             default=DEFAULT_TRANSLATION_INSTRUCTIONS
         )
+        if audio_source is None:
+            ConfigManager().subscribe(
+                "PROMPT", lambda key, prompt: self.set_translation_prompt(prompt)
+            )
+        # Incoming events are routed by type; see _event_handlers().
+        self.events = EventRouter(self._event_handlers())
+        self.translation_cache = TranslationCache(
+            persistent=ConfigManager().get("TRANSLATION_CACHE_PERSIST", False)
+        )
 
     # ==========================================================
     # Public API
@@ -69,27 +207,60 @@ class RealtimeAPIClient(UIMessageMixin):
 
     def set_commit_level(self, level):
         self.commit_level = level
+        if hasattr(self.vad, "energy_threshold"):
+            self.vad.energy_threshold = level
         self.ui_msg(UIMessageType.SYS_LOG, f"🔈 Silence level updated: {level}")
 
+    def set_max_concurrent_responses(self, limit):
+        self.max_concurrent_responses = max(1, int(limit))
+        self.ui_msg(
+            UIMessageType.SYS_LOG,
+            f"🔀 Concurrent translations: {self.max_concurrent_responses}",
+        )
+
+    def set_speculative_translation(self, enabled, stable_seconds=None):
+        self.speculative_translation = enabled
+        if stable_seconds is not None:
+            self.speculation_stable_seconds = stable_seconds
+        state = "ON" if enabled else "OFF"
+        self.ui_msg(UIMessageType.SYS_LOG, f"⚡ Speculative translation: {state}")
+
+    def set_vad(self, vad):
+        """Replace the voice-activity detector (a VoiceActivityDetector)."""
+        self.vad = vad
+        self.ui_msg(UIMessageType.SYS_LOG, f"🗣 VAD: {type(vad).__name__}")
+
     def set_translation_prompt(self, prompt):
         self.translation_prompt = prompt or DEFAULT_TRANSLATION_INSTRUCTIONS
+        if self.loop and self.loop.is_running():
+            # Open translation sessions pick the prompt up via session.update.
+            session = self._translation_session()
+            for conn in list(self.translation_pool):
+                self.loop.call_soon_threadsafe(conn.update_session, session)
         self.ui_msg(UIMessageType.SYS_LOG, "📝 Translation prompt updated.")
 
-    def start(self):
-        """Start realtime thread"""
+    def set_append_coalescing(self, max_latency=None, max_payload_bytes=None):
+        """Tune append merging (applies from the next connection)."""
+        if max_latency is not None:
+            self.append_max_latency = max_latency
+        if max_payload_bytes is not None:
+            self.append_max_payload_bytes = max_payload_bytes
+
+    def start(self, stream_audio=True):
+        """Start realtime thread (or start streaming on a pre-warmed one)"""
         if self.main_task and not self.main_task.done():
-            self.ui_msg(UIMessageType.SYS_LOG, "⚠️ Already running")
+            if stream_audio and not self.stream_audio:
+                self._set_streaming(True)
+                self.ui_msg(UIMessageType.SYS_LOG, "🚀 Realtime streaming")
+            else:
+                self.ui_msg(UIMessageType.SYS_LOG, "⚠️ Already running")
             return
 
-        api_key = ConfigManager().get_api_key()
-        if not api_key:
-            self.ui_msg(
-                UIMessageType.SYS_LOG,
-                "⚠️ API Key is not set. Please set it before starting audio.",
-            )
+        if not self._check_api_key():
             return
 
         self.stop_flag = False
+        self._set_streaming(stream_audio)
         self.loop = asyncio.new_event_loop()
         self.main_task = asyncio.ensure_future(self._runner(), loop=self.loop)
 
@@ -99,441 +270,991 @@ class RealtimeAPIClient(UIMessageMixin):
 
         self.ui_msg(UIMessageType.SYS_LOG, "🚀 Realtime STARTED")
 
+    async def run(self, stream_audio=True):
+        """Run on the calling event loop until stop() (start() without a thread).
+
+        Several clients can share one loop this way.
+        """
+        if not self._check_api_key():
+            return
+        self.stop_flag = False
+        self._set_streaming(stream_audio)
+        self.loop = asyncio.get_running_loop()
+        self.main_task = asyncio.ensure_future(self._runner())
+        self.ui_msg(UIMessageType.SYS_LOG, "🚀 Realtime STARTED")
+        await self.main_task
+
+    async def drain(self, poll=0.1):
+        """Finish a finite audio source (see FileAudioSource) while run() runs.
+
+        Waits until the source is exhausted, commits the last utterance and
+        waits for the outstanding transcripts and translations. Gives up
+        (returns False) after translation_timeout without progress.
+        """
+        task = self.main_task
+        if task is None:
+            return False
+        while not getattr(self.audio, "exhausted", True) and not task.done():
+            await asyncio.sleep(poll)
+        # Commits the last utterance.
+        self.pause()
+        shown = self.next_emit_seq
+        deadline = time.time() + self.translation_timeout
+        while not task.done():
+            if not self.sending and self.is_idle():
+                return True
+            if self.next_emit_seq != shown:
+                shown = self.next_emit_seq
+                deadline = time.time() + self.translation_timeout
+            elif time.time() > deadline:
+                return False
+            await asyncio.sleep(poll)
+        return True
+
+    def is_idle(self):
+        """True when everything committed so far has been translated and shown."""
+        return (
+            not self.audio_replay.pending()
+            and not self.item_seqs
+            and not self.translation_queue
+            and not self.pending_response_requests
+            and not self.inflight_requests
+            and self.next_emit_seq == self.next_translation_seq
+        )
+
+    def prewarm(self):
+        """Open and configure the sessions now; stream once start() is called.
+
+        Idle sessions are kept alive by websocket pings and reconnected (with
+        the same config) if they drop.
+        """
+        self.start(stream_audio=False)
+
+    def pause(self):
+        """Stop streaming audio but keep the sessions open for the next start()."""
+        if self.stream_audio:
+            self._set_streaming(False)
+            self.ui_msg(UIMessageType.SYS_LOG, "⏸ Realtime streaming paused")
+            if self.loop and self.loop.is_running():
+                # The runner (which saves on exit) keeps going while paused.
+                asyncio.run_coroutine_threadsafe(
+                    self._save_translation_cache(), self.loop
+                )
+
+    def save_translation_cache(self):
+        """Write the translation cache if it is persistent (any thread)."""
+        try:
+            self.translation_cache.save()
+        except Exception as e:
+            translation_logger.error(f"❌ Could not save translation cache: {e}")
+
     def stop(self):
         """Stop realtime safely"""
         self.ui_msg(UIMessageType.SYS_LOG, "🛑 Realtime STOP requested")
         self.stop_flag = True
 
-        if self.ws and self.loop and self.loop.is_running():
-            try:
-                # Ask for a graceful close first so we do not emit noisy close-frame errors.
-                asyncio.run_coroutine_threadsafe(self.ws.close(code=1000), self.loop)
-            except Exception:
-                try:
-                    self.ws.fail_connection()
-                except Exception:
-                    pass
+        if self.loop and self.loop.is_running():
+            for conn in [self.transcription, *self.translation_pool]:
+                if conn is not None:
+                    asyncio.run_coroutine_threadsafe(conn.close(), self.loop)
 
     # ==========================================================
     # Internals
     # ==========================================================
 
+    def _check_api_key(self):
+        if ConfigManager().get_api_key():
+            return True
+        self.ui_msg(
+            UIMessageType.SYS_LOG,
+            "⚠️ API Key is not set. Please set it before starting audio.",
+        )
+        return False
+
+    def _set_streaming(self, enabled):
+        self.stream_audio = enabled
+        if enabled:
+            self.streaming_requested_at = time.time()
+            self.streaming_warm = bool(self.transcription and self.transcription.ready)
+        if self.loop and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._apply_streaming)
+
+    def _apply_streaming(self):
+        if self.streaming is None:
+            return
+        if self.stream_audio:
+            self.streaming.set()
+        else:
+            self.streaming.clear()
+
+    def _note_caption(self):
+        """Report time-to-first-caption once per start of streaming."""
+        started_at = self.streaming_requested_at
+        if started_at is None:
+            return
+        self.streaming_requested_at = None
+        session = "warm" if self.streaming_warm else "cold"
+        message = f"⏱ First caption {time.time() - started_at:.2f}s after start ({session} session)"
+        self.ui_msg(UIMessageType.SYS_LOG, message)
+        logger.info(message)
+
     async def _runner(self):
         """Main lifecycle"""
+        # Locks and events bind to the loop that first uses them; each
+        # start() has its own.
+        self.translation_lock = asyncio.Lock()
+        self.streaming = asyncio.Event()
+        self._apply_streaming()
+        self._resume_capture = False
+        translation_tasks = [
+            asyncio.create_task(self._translation_worker(i))
+            for i in range(max(1, self.translation_connections))
+        ]
+
+        conn = RealtimeConnection("transcription", self.ws_url, TRANSCRIPTION_SESSION)
+        self.transcription = conn
         while not self.stop_flag:
             try:
-                await self._connect_and_run()
+                await self._connect_and_run(conn)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 if self.stop_flag:
                     break
                 self.ui_msg(UIMessageType.SYS_LOG, f"❌ Error: {e}")
-                logging.error(f"❌ Error: {e}")
+                logger.error(f"❌ Error: {e}")
                 if isinstance(e, ValueError):
                     # Session payload/config errors are deterministic; avoid reconnect storm.
                     self.stop_flag = True
                     break
-                await asyncio.sleep(1)
-
+            await self._reconnect_delay(conn)
+
+        for task in translation_tasks:
+            task.cancel()
+        await asyncio.gather(*translation_tasks, return_exceptions=True)
+        self._log_event_stats()
+        self._log_latency_stats()
+        self.latency.close()
+        await self._save_translation_cache()
         self.ui_msg(UIMessageType.SYS_LOG, "🛑 Realtime STOPPED")
 
-    async def _connect_and_run(self):
-        """Connect → configure session → run sender + receiver"""
-        headers = [
-            (
-                "Authorization",
-                f"Bearer {ConfigManager().get_api_key()}",
-            ),
-        ]
-
-        self.ws = await websockets.connect(WS_URL, extra_headers=headers)
-        self.ui_msg(UIMessageType.SYS_LOG, "🔗 WS Connected")
-
-        # It is not explicitly stated whether you must wait for session.created before sending session.update
-        # so, just ignore session.created
-
-        # sending session update
-        await self.ws.send(
-            json.dumps(
-                {
-                    "type": "session.update",
-                    "session": {
-                        "type": "realtime",
-                        "output_modalities": ["text"],
-                        "audio": {
-                            "input": {
-                                "turn_detection": None,
-                                "transcription": {"model": "gpt-4o-mini-transcribe"},
-                            }
-                        },
-                        "instructions": (
-                            "Your only task is transcription. Output must contain only the raw spoken text with no explanations, no comments, no punctuation suggestions, and no metadata. Do not add anything else. "
-                            "Output only plain text. Do not use JSON, quotes, code blocks, or any formatting."
-                        ),
-                    },
-                }
+    async def _connect_and_run(self, conn):
+        """Connect → configure session → replay → run sender + receiver"""
+        try:
+            await conn.open(ConfigManager().get_api_key())
+            self.ws = conn.ws
+            self.ui_msg(UIMessageType.SYS_LOG, "🎤 Whisper READY")
+            await self._replay_uncommitted_audio()
+            await self._run_until_first_exit(self._sender(), self._receiver(conn))
+        finally:
+            await conn.close()
+
+    async def _replay_uncommitted_audio(self):
+        """Resend audio the previous session never transcribed, in order.
+
+        Committed utterances are committed again and keep their translation
+        slots; the utterance still being recorded is only appended.
+        """
+        self.buffered_audio_bytes = 0
+        utterances, open_chunks = self.audio_replay.take()
+        replayed = 0
+        for item_id, chunks, seq, trace in utterances:
+            if item_id is not None:
+                # Its transcript will arrive under a new item id.
+                self.caption_parts.pop(item_id, None)
+                self._cancel_speculation(item_id)
+                seq = self.item_seqs.pop(item_id, seq)
+            if not chunks:
+                # Trimmed from the replay buffer: give up on it.
+                if seq is not None:
+                    self._resolve_seq(seq, "")
+                continue
+            replayed += await self._send_chunks(chunks)
+            await self._commit("🔁 Commit (replay)", seq=seq, trace=trace)
+        replayed += await self._send_chunks(open_chunks)
+        if replayed:
+            bytes_per_second = self.audio.samplerate * 2
+            self.ui_msg(
+                UIMessageType.SYS_LOG,
+                f"🔁 Replayed {replayed / bytes_per_second:.1f}s of untranscribed audio",
             )
-        )
-
-        # Trigger subsequent events only after confirming session.updated
-        await self._wait_for_session_updated(timeout_sec=10)
 
-        self.ui_msg(UIMessageType.SYS_LOG, "🎤 Whisper READY")
-        sender_task = asyncio.create_task(self._sender())
-        receiver_task = asyncio.create_task(self._receiver())
-
-        done, pending = await asyncio.wait(
-            {sender_task, receiver_task}, return_when=asyncio.FIRST_COMPLETED
+    async def _send_chunks(self, chunks):
+        """Append ``chunks`` in as few messages as the payload limit allows."""
+        coalescer = AppendCoalescer(max_payload_bytes=self.append_max_payload_bytes)
+        for chunk in chunks:
+            coalescer.add(chunk, 0)
+        sent = len(coalescer)
+        while len(coalescer):
+            pcm_bytes, _ = coalescer.take()
+            await self._send_append(pcm_bytes)
+        return sent
+
+    async def _reconnect_delay(self, conn):
+        if self.stop_flag:
+            return
+        delay = conn.next_backoff()
+        self.ui_msg(
+            UIMessageType.SYS_LOG, f"🔁 {conn.name}: reconnecting in {delay:.1f}s"
         )
-
-        # cancel all
-        for t in pending:
-            t.cancel()
-
-        try:
-            await self.ws.close()
-        except Exception:
-            pass
-
-    async def _wait_for_session_updated(self, timeout_sec=10):
-        deadline = time.time() + timeout_sec
+        deadline = time.time() + delay
+        # Short steps so stop() is not held up by a long backoff.
         while not self.stop_flag and time.time() < deadline:
-            try:
-                raw = await asyncio.wait_for(self.ws.recv(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
+            await asyncio.sleep(min(0.25, deadline - time.time()))
 
-            msg = json.loads(raw)
-            t = msg.get("type")
-
-            if t == "session.updated":
-                logging.info(f"✅ SESSION UPDATED:{msg.get('session')}")
-                return
+    async def _translation_worker(self, index):
+        """Keep one translation session open and serve responses on it."""
+        name = f"translation-{index + 1}"
+        conn = RealtimeConnection(name, self.ws_url, self._translation_session())
+        self.translation_pool.append(conn)
+        try:
+            while not self.stop_flag:
+                try:
+                    await conn.open(ConfigManager().get_api_key())
+                    self.ui_msg(UIMessageType.SYS_LOG, f"🌐 Translator READY ({name})")
+                    await self._dispatch_next_response_request()
+                    await self._run_until_first_exit(
+                        self._receiver(conn), conn.run_sender()
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if self.stop_flag:
+                        break
+                    self.ui_msg(UIMessageType.SYS_LOG, f"❌ {name} error: {e}")
+                    logger.error(f"❌ {name} error: {e}")
+                    if isinstance(e, ValueError):
+                        self.stop_flag = True
+                        break
+                finally:
+                    await conn.close()
+                    self._requeue_connection_requests(conn)
 
-            if t == "error":
-                err = msg.get("error", msg)
-                code = ""
-                if isinstance(err, dict):
-                    code = err.get("code", "")
-                if code in {"unknown_parameter", "missing_required_parameter"}:
-                    raise ValueError(f"session.update failed: {err}")
-                raise RuntimeError(f"session.update failed: {err}")
+                # Other translation sessions may take over the lost requests.
+                await self._dispatch_next_response_request()
+                await self._reconnect_delay(conn)
+        finally:
+            self.translation_pool.remove(conn)
 
-            logging.info(f"↪ pre-ready event: {t}")
+    def _translation_session(self):
+        return {
+            "type": "realtime",
+            "output_modalities": ["text"],
+            "audio": {"input": {"turn_detection": None}},
+            "instructions": self.translation_prompt
+            + "\n\n"
+            + BATCH_TRANSLATION_INSTRUCTIONS,
+        }
 
-        raise TimeoutError("Timeout waiting for session.updated")
+    @staticmethod
+    async def _run_until_first_exit(*coros):
+        tasks = [asyncio.create_task(coro) for coro in coros]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
 
     # ==========================================================
     # Sender
     # ==========================================================
 
     async def _sender(self):
-        audio_q = AudioStreamManager().audio_queue
-        last_commit = time.time()
-        last_audio_activity = time.time()
-        max_buffer_seconds = 4.0
-        last_status_log = 0.0
-        status_log_interval = 2.0
-
+        audio_manager = self.audio
         while not self.stop_flag:
+            # A pre-warmed session idles here until the mic starts.
+            await self.streaming.wait()
+            # After a reconnect, pick up the audio captured meanwhile.
+            resume = self._resume_capture
+            wakeup = audio_manager.attach_consumer(
+                asyncio.get_running_loop(), resume=resume
+            )
+            self.sending = True
             try:
-                pcm_bytes, volume = audio_q.get_nowait()
-            except Empty:
-                now = time.time()
-                if self.buffered_audio_bytes > 0:
-                    total_bytes = self.buffered_audio_bytes
-                    enough_audio = total_bytes >= 16000 * 0.5 * 2
-                    idle_long_enough = now - last_audio_activity > 0.8
-                    commit_gap_ok = now - last_commit > 0.8
-                    if enough_audio and idle_long_enough and commit_gap_ok:
-                        try:
-                            await self.ws.send(
-                                json.dumps({"type": "input_audio_buffer.commit"})
-                            )
-                            self.ui_msg(
-                                UIMessageType.SYS_LOG,
-                                "🎯 Commit volume:0 (inactivity)",
-                            )
-                            self.ui_msg(
-                                UIMessageType.LOG,
-                                "🎯 Commit volume:0 (inactivity)",
-                            )
-                            last_commit = now
-                            self.buffered_audio_bytes = 0
-                        except Exception as e:
-                            self.ui_msg(UIMessageType.SYS_LOG, f"❌ Send error:{e}")
-                            self.ui_msg(UIMessageType.LOG, f"❌ Send error:{e}")
-                    elif now - last_status_log > status_log_interval:
-                        buffered_seconds = total_bytes / (16000 * 2)
-                        self.ui_msg(
-                            UIMessageType.LOG,
-                            "⌛ Commit待機: "
-                            f"buffer={buffered_seconds:.2f}s, "
-                            f"idle={now - last_audio_activity:.2f}s, "
-                            f"since_commit={now - last_commit:.2f}s",
-                        )
-                        last_status_log = now
-                elif now - last_status_log > status_log_interval:
-                    self.ui_msg(
-                        UIMessageType.LOG,
-                        "⌛ Commit待機: 音声フレームなし "
-                        f"(min_volume_for_speech={AudioStreamManager().min_volume_for_speech})",
-                    )
-                    last_status_log = now
-                await asyncio.sleep(0.05)
-                continue
-
-            last_audio_activity = time.time()
-
-            enc = base64.b64encode(pcm_bytes).decode()
-
-            # When you send an input_audio_buffer.append event,
-            # the server does not send a confirmation response to this event.
-            # The only time you will receive a related server event is when speech is detected and committed (if VAD is enabled),
-            # at which point you may receive events like input_audio_buffer.committed,
-            # but not as a direct response to each append.
-            try:
-                await self.ws.send(
-                    json.dumps({"type": "input_audio_buffer.append", "audio": enc})
-                )
-            except Exception as e:
-                self.ui_msg(UIMessageType.SYS_LOG, f"❌ Send error:{e}")
-                continue
+                connected = await self._send_loop(audio_manager, wakeup, resume)
+            finally:
+                self.sending = False
+                audio_manager.detach_consumer()
+                self._resume_capture = self.streaming.is_set() and not self.stop_flag
+            if not connected:
+                break
 
-            self.buffered_audio_bytes += len(pcm_bytes)
+        raise asyncio.CancelledError()
 
-            total_bytes = self.buffered_audio_bytes
-            buffered_seconds = total_bytes / (16000 * 2)
+    async def _send_loop(self, audio_manager, wakeup, resume=False):
+        """Stream audio until streaming stops; returns False if a send failed."""
+        coalescer = AppendCoalescer(
+            max_latency=self.append_max_latency,
+            max_payload_bytes=self.append_max_payload_bytes,
+        )
+        if not resume:
+            # A fresh start; on resume the VAD and rolls continue the
+            # utterance that was open when the connection dropped.
+            self.vad.reset()
+            self._utterance_trace = None
+            self._pre_roll = deque()
+            self._pre_roll_ms = 0.0
+            self._post_roll_left_ms = 0.0
+        block_seconds = audio_manager.blocksize / audio_manager.samplerate
+        bytes_per_second = audio_manager.samplerate * 2
+        last_upload = time.time()
+        last_status_log = 0.0
+        status_log_interval = 2.0
+        volume = 0
 
-            if total_bytes < (
-                16000 * 0.5 * 2
-            ):  # 500ms = 16000 sample/s * 0.5, 16-bit = x2
-                await asyncio.sleep(0.05)
+        while not self.stop_flag and self.streaming.is_set():
+            if self._read_ahead_exceeded(bytes_per_second):
+                await asyncio.sleep(block_seconds)
                 continue
 
-            # Send it when all three conditions are met.
+            # Speech blocks wake us through ``wakeup``. While an utterance is
+            # open we also wake once per block so the VAD sees the quiet blocks
+            # that end it; otherwise only the status line wakes a silent room.
             now = time.time()
-            if (
-                total_bytes >= 16000 * 0.5 * 2  # at least 500ms of audio
-                and now - last_commit > 3  # at least 3 seconds since last commit
-                and volume < self.commit_level  # audio level is low
-            ):
-                # WebSocket sending is asynchronous, so even if you call send(append) and then send(commit) in that order,
-                # the server is not guaranteed to receive them in the same order. When the sender runs fast,
-                # the messages can arrive as commit first, causing Whisper to think the audio buffer is incomplete.
-                await asyncio.sleep(0.05)
-
-                # When you send an input_audio_buffer.commit event,
-                # the server will create a new user message item in the conversation from the current audio buffer.
-                # This will trigger input audio transcription (if enabled in the session configuration),
-                # but it will not automatically create a response from the model.
-                # The server will respond with an input_audio_buffer.committed event, which includes the ID of the new user message item.
-                # If the input audio buffer is empty, the server will return an error
-                # However, the specific error message or code is not provided in the available knowledge
-                #
-                # When you call input_audio_buffer.commit,
-                # all audio in the buffer up to that point is used to create a new user message item in the conversation,
-                # and the buffer is cleared. This is stated in the documentation
-                #
-                # If there is audio in the buffer but it is only noise (not silence),
-                # the knowledge sources do not state that this will cause an error. Instead,
-                # the model may attempt to transcribe or interpret the noisy audio.
-                # In cases of unintelligible or unclear audio, the model might respond with a clarification request or similar behavior,
-                # but this is not treated as an error by the API itself
-                #
-                # when you send an input_audio_buffer.commit event,
-                # the server will respond with an input_audio_buffer.committed event,
-                # which includes the ID of the new user message item that will be created.
-                # After this, you may also receive additional events related to the processing of the committed audio,
-                # such as transcription events (conversation.item.input_audio_transcription.delta and
-                # conversation.item.input_audio_transcription.completed)
-                # if transcription is enabled in your session
-                try:
-                    await self.ws.send(
-                        json.dumps({"type": "input_audio_buffer.commit"})
-                    )
-                    self.ui_msg(UIMessageType.SYS_LOG, f"🎯 Commit volume:{volume}")
-                    self.ui_msg(UIMessageType.LOG, f"🎯 Commit volume:{volume}")
-                    last_commit = now
-                    self.buffered_audio_bytes = 0
-                except Exception as e:
-                    self.ui_msg(UIMessageType.SYS_LOG, f"❌ Send error:{e}")
-                    self.ui_msg(UIMessageType.LOG, f"❌ Send error:{e}")
-                    continue
-
-                await asyncio.sleep(0.05)
+            if self.vad.in_speech or self.buffered_audio_bytes > 0:
+                timeout = block_seconds
+            else:
+                timeout = max(last_status_log + status_log_interval - now, 0)
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
 
-                # Sending translation event
-                await self._flush_translation_queue()
+            speech_ended = self._collect_blocks(audio_manager, coalescer)
+            if len(coalescer):
+                speech_ended |= await self._coalesce_frames(
+                    audio_manager, wakeup, coalescer
+                )
+                while len(coalescer):
+                    pcm_bytes, volume = coalescer.take()
+                    if not await self._send_append(pcm_bytes):
+                        # The socket is gone: the rest waits for the replay
+                        # after the reconnect, like the failed append.
+                        while len(coalescer):
+                            self.audio_replay.append(coalescer.take()[0])
+                        return False
+                last_upload = time.time()
 
-            # Fallback commit: if continuous input never drops below threshold,
-            # flush periodically to avoid getting stuck behind noise floor.
+            now = time.time()
+            buffered_seconds = self.buffered_audio_bytes / bytes_per_second
+            committed = None
+            if buffered_seconds >= self.min_commit_seconds and speech_ended:
+                committed = await self._commit(f"🎯 Commit volume:{volume:.0f} (vad)")
+            elif buffered_seconds >= self.max_utterance_seconds:
+                # Never-ending speech (or a noise floor the VAD treats as
+                # speech): flush periodically so captions keep coming.
+                committed = await self._commit(
+                    f"🎯 Commit volume:{volume:.0f} "
+                    f"(max_buffer={buffered_seconds:.2f}s)"
+                )
             elif (
-                total_bytes >= 16000 * 0.5 * 2
-                and now - last_commit > 1.2
-                and buffered_seconds >= max_buffer_seconds
+                buffered_seconds >= self.min_commit_seconds
+                and not self.vad.in_speech
+                and now - last_upload >= self.inactivity_commit_seconds
             ):
-                try:
-                    await self.ws.send(
-                        json.dumps({"type": "input_audio_buffer.commit"})
-                    )
+                # Audio loud enough to upload that the VAD never called speech.
+                committed = await self._commit("🎯 Commit volume:0 (inactivity)")
+            elif now - last_status_log >= status_log_interval:
+                if self.buffered_audio_bytes > 0:
                     self.ui_msg(
-                        UIMessageType.SYS_LOG,
-                        f"🎯 Commit volume:{volume} (max_buffer)",
+                        UIMessageType.LOG,
+                        "⌛ Commit待機: "
+                        f"buffer={buffered_seconds:.2f}s, "
+                        f"speech={self.vad.in_speech}, "
+                        f"idle={now - last_upload:.2f}s",
                     )
+                else:
                     self.ui_msg(
                         UIMessageType.LOG,
-                        f"🎯 Commit volume:{volume} (max_buffer={buffered_seconds:.2f}s)",
+                        "⌛ Commit待機: 音声フレームなし "
+                        f"(min_volume_for_speech={audio_manager.min_volume_for_speech})",
                     )
-                    last_commit = now
-                    self.buffered_audio_bytes = 0
-                except Exception as e:
-                    self.ui_msg(UIMessageType.SYS_LOG, f"❌ Send error:{e}")
-                    self.ui_msg(UIMessageType.LOG, f"❌ Send error:{e}")
-                    continue
-
-                await asyncio.sleep(0.05)
-                await self._flush_translation_queue()
+                last_status_log = now
+            if committed is False:
+                return False
+
+        buffered_seconds = self.buffered_audio_bytes / bytes_per_second
+        if not self.stop_flag and buffered_seconds >= self.min_commit_seconds:
+            # Mic stopped mid-utterance: transcribe what was already sent.
+            return await self._commit(f"🎯 Commit volume:{volume:.0f} (paused)")
+        return True
+
+    def _read_ahead_exceeded(self, bytes_per_second):
+        limit = self.max_untranscribed_seconds
+        return limit is not None and len(self.audio_replay) >= limit * bytes_per_second
+
+    def _collect_blocks(self, audio_manager, coalescer):
+        """Run new blocks through the VAD and queue the ones worth uploading.
+
+        Blocks at or above ``min_volume_for_speech`` are uploaded, and so is
+        everything inside a VAD utterance. Quiet blocks right before a loud one
+        (``pre_roll_ms``) and right after it (``post_roll_ms``) go along so
+        soft word onsets and endings are not clipped; longer silences stay
+        local. Returns True if the VAD closed an utterance in these blocks.
+        """
+        speech_ended = False
+        bytes_per_ms = audio_manager.samplerate * 2 / 1000
+        for pcm, volume, captured_at in audio_manager.read_blocks():
+            event = self.vad.process(pcm, volume)
+            if event == VADEvent.SPEECH_START:
+                self.ui_msg(UIMessageType.LOG, "🗣 Speech start")
+            elif event == VADEvent.SPEECH_END:
+                speech_ended = True
+
+            block_ms = len(pcm) / bytes_per_ms
+            if volume >= audio_manager.min_volume_for_speech:
+                if self._utterance_trace is None:
+                    self._utterance_trace = LatencyTracer.begin(captured_at)
+                while self._pre_roll:
+                    coalescer.add(*self._pre_roll.popleft())
+                self._pre_roll_ms = 0.0
+                self._post_roll_left_ms = audio_manager.post_roll_ms
+                coalescer.add(pcm, volume)
+            elif self.vad.in_speech or self._post_roll_left_ms > 0:
+                self._post_roll_left_ms -= block_ms
+                coalescer.add(pcm, volume)
+            else:
+                # Views into the capture ring; they stay valid far longer than
+                # the pre-roll window.
+                self._pre_roll.append((pcm, volume))
+                self._pre_roll_ms += block_ms
+                while self._pre_roll and self._pre_roll_ms > audio_manager.pre_roll_ms:
+                    dropped, _ = self._pre_roll.popleft()
+                    self._pre_roll_ms -= len(dropped) / bytes_per_ms
+        return speech_ended
+
+    async def _coalesce_frames(self, audio_manager, wakeup, coalescer):
+        """Pull pending blocks into ``coalescer`` before the next append.
+
+        Returns True if the VAD closed an utterance meanwhile.
+        """
+        # Blocks that piled up while the previous append was being written
+        # go out together so we catch up after a stall.
+        speech_ended = self._collect_blocks(audio_manager, coalescer)
+
+        # The socket is still flushing the previous append: keep collecting
+        # blocks until it drains or the oldest block hits max latency.
+        while (
+            not speech_ended
+            and not coalescer.is_full()
+            and self.transcription.backlog() > 0
+        ):
+            remaining = coalescer.deadline() - time.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            wakeup.clear()
+            speech_ended = self._collect_blocks(audio_manager, coalescer)
+        return speech_ended
+
+    async def _send_append(self, pcm_bytes):
+        message = await realtime_codec.encode_append_async(pcm_bytes)
+
+        # When you send an input_audio_buffer.append event,
+        # the server does not send a confirmation response to this event.
+        # The only time you will receive a related server event is when speech is detected and committed (if VAD is enabled),
+        # at which point you may receive events like input_audio_buffer.committed,
+        # but not as a direct response to each append.
+        try:
+            await self.ws.send(message)
+        except Exception as e:
+            self.ui_msg(UIMessageType.SYS_LOG, f"❌ Send error:{e}")
+            self.audio_replay.append(pcm_bytes)
+            return False
+
+        self.buffered_audio_bytes += len(pcm_bytes)
+        self.audio_replay.append(pcm_bytes)
+        LatencyTracer.mark(self._utterance_trace, "appended")
+        return True
+
+    async def _commit(self, message, seq=None, trace=None):
+        # When you send an input_audio_buffer.commit event,
+        # the server will create a new user message item in the conversation from the current audio buffer.
+        # This will trigger input audio transcription (if enabled in the session configuration),
+        # but it will not automatically create a response from the model.
+        # The server will respond with an input_audio_buffer.committed event, which includes the ID of the new user message item.
+        # If the input audio buffer is empty, the server will return an error
+        #
+        # When you call input_audio_buffer.commit,
+        # all audio in the buffer up to that point is used to create a new user message item in the conversation,
+        # and the buffer is cleared.
+        #
+        # Appends and the commit are sent in order on the same socket from this
+        # task, so the commit always covers every append before it.
+        try:
+            await self.ws.send(realtime_codec.COMMIT_MESSAGE)
+        except Exception as e:
+            self.ui_msg(UIMessageType.SYS_LOG, f"❌ Send error:{e}")
+            self.ui_msg(UIMessageType.LOG, f"❌ Send error:{e}")
+            sent = False
+        else:
+            self.ui_msg(UIMessageType.SYS_LOG, message)
+            self.ui_msg(UIMessageType.LOG, message)
+            sent = True
 
-        raise asyncio.CancelledError()
+        self.buffered_audio_bytes = 0
+        if trace is None:
+            trace, self._utterance_trace = self._utterance_trace, None
+        # An unsent commit still closes the utterance: the replay after the
+        # reconnect commits it, so it is not merged with the next one.
+        self.audio_replay.commit(seq, trace)
+        if not sent:
+            return False
+        LatencyTracer.mark(trace, "commit_sent")
+
+        # Sending translation event
+        await self._flush_translation_queue()
+        return True
 
     # ==========================================================
     # Receiver
     # ==========================================================
 
-    async def _receiver(self):
-        while not self.stop_flag:
-            try:
-                raw = await asyncio.wait_for(self.ws.recv(), timeout=1.0)
-            except asyncio.TimeoutError:
-                await asyncio.sleep(0.005)
-                continue
-            except Exception:
+    async def _receiver(self, conn):
+        async for raw in conn.messages():
+            if self.stop_flag:
+                break
+            if await self.events.dispatch(raw, conn):
                 break
 
-            msg = json.loads(raw)
-            t = msg.get("type")
-            # logging.info(f"📩 Realtime event type: {t}")
-            if t == "rate_limits.updated":
-                pass
-            elif t == "input_audio_buffer.committed":
-                self.buffered_audio_bytes = 0
-            elif t == "conversation.item.created":
-                item = msg.get("item", {})
-                if item.get("role") != "user":
-                    continue
-                for c in item.get("content", []):
-                    text = (c.get("transcript") or c.get("text") or "").strip()
-                    if text:
-                        self.ui_msg(UIMessageType.CAPTION, text)
-                        break
-            elif t == "conversation.item.input_audio_transcription.delta":
-                pass
-            elif t == "conversation.item.input_audio_transcription.completed":
-                text = msg.get("transcript", "").strip()
-                if text:
-                    self.ui_msg(UIMessageType.CAPTION, text)
-                    self.translation_queue.append(text)
-                    await self._flush_translation_queue()
-            elif t == "response.output_text.delta":
-                pass
-            elif t == "response.output_text.done":
-                text = (msg.get("text") or "").strip()
-                if not text:
-                    continue
-                self.ui_msg(UIMessageType.TRANSLATED, text)
-            elif t == "response.output_audio_transcript.done":
-                # We request translation as text-only responses.
-                pass
-            elif t == "response.output_item.added":
-                pass
-            elif t == "response.created":
-                pass
-            elif t == "response.content_part.added":
-                pass
-            elif t == "response.text.delta":
-                pass
-            elif t == "response.text.done":
-                pass
-            elif t == "response.content_part.done":
-                pass
-            elif t == "response.output_item.done":
-                # handled by response.output_text.done / response.output_audio_transcript.done
-                pass
+        raise asyncio.CancelledError()
 
-            elif t == "response.done":
-                self.response_in_flight = False
-                await self._dispatch_next_response_request()
+    def _event_handlers(self):
+        # Event types not listed here are skipped without being parsed.
+        return {
+            "input_audio_buffer.committed": self._handle_audio_committed,
+            "conversation.item.created": self._handle_item_created,
+            "conversation.item.input_audio_transcription.delta": self._handle_transcription_delta,
+            "conversation.item.input_audio_transcription.completed": self._handle_transcription_completed,
+            "conversation.item.input_audio_transcription.failed": self._handle_transcription_failed,
+            "response.created": self._handle_response_created,
+            "response.output_text.delta": self._handle_output_text_delta,
+            "response.output_text.done": self._handle_output_text_done,
+            "response.done": self._handle_response_done,
+            "error": self._handle_error,
+        }
 
-            elif t == "error":
-                err = msg.get("error", {})
-                code = err.get("code") if isinstance(err, dict) else None
+    def _log_latency_stats(self):
+        for name, (p50, p95, n) in self.latency.percentiles().items():
+            logger.info(f"⏱ {name}: p50={p50:.0f}ms p95={p95:.0f}ms n={n}")
 
-                if code == "conversation_already_has_active_response":
-                    # Keep the socket alive and wait for response.done.
-                    self.response_in_flight = True
-                    self.ui_msg(
-                        UIMessageType.SYS_LOG,
-                        "⏳ Response in progress, waiting before next request.",
-                    )
-                    continue
+    def _log_event_stats(self):
+        for event_type, stat in self.events.stats().items():
+            logger.info(
+                f"📊 {event_type}: count={stat['count']} "
+                f"handler_total={stat['total_ms']:.1f}ms max={stat['max_ms']:.2f}ms"
+            )
 
-                if code == "input_audio_buffer_commit_empty":
-                    # Server-side VAD may have already committed and cleared the buffer.
-                    self.buffered_audio_bytes = 0
-                    self.ui_msg(
-                        UIMessageType.LOG,
-                        "ℹ️ Skip empty commit (buffer already cleared).",
-                    )
-                    continue
+    async def _handle_audio_committed(self, msg, conn):
+        # buffered_audio_bytes was reset when the commit was sent; by now it
+        # may already count the next utterance.
+        item_id = msg.get("item_id")
+        seq, trace = self.audio_replay.committed(item_id)
+        if seq is not None and item_id is not None:
+            # A replayed utterance keeps its original slot.
+            self.item_seqs[item_id] = seq
+        # Reserve the translation slot in commit (= speech) order.
+        seq = self._item_seq(item_id)
+        self.latency.bind(seq, trace)
+        self.latency.mark_seq(seq, "committed")
+
+    async def _handle_item_created(self, msg, conn):
+        item = msg.get("item", {})
+        if item.get("role") != "user":
+            return
+        item_id = item.get("id")
+        if item_id in self.captioned_items or item_id in self.caption_parts:
+            return
+        for c in item.get("content", []):
+            text = (c.get("transcript") or c.get("text") or "").strip()
+            if text:
+                self._mark_captioned(item_id)
+                self.ui_msg(
+                    UIMessageType.CAPTION, text, seq=self.item_seqs.get(item_id)
+                )
+                self._note_caption()
+                break
 
+    async def _handle_transcription_delta(self, msg, conn):
+        item_id = msg.get("item_id")
+        text = self.caption_parts.get(item_id, "") + (msg.get("delta") or "")
+        self.caption_parts[item_id] = text
+        if text.strip():
+            self.ui_msg(UIMessageType.CAPTION_PARTIAL, text.strip())
+            self._note_caption()
+            if self.speculative_translation:
+                await self._on_transcript_prefix(item_id, text.strip())
+
+    async def _handle_transcription_completed(self, msg, conn):
+        item_id = msg.get("item_id")
+        self.audio_replay.finished(item_id)
+        self.caption_parts.pop(item_id, None)
+        seq = self._item_seq(item_id)
+        self.item_seqs.pop(item_id, None)
+        self.latency.mark_seq(seq, "transcribed")
+        text = msg.get("transcript", "").strip()
+        if text:
+            if item_id not in self.captioned_items:
+                self._mark_captioned(item_id)
+                self.ui_msg(UIMessageType.CAPTION, text, seq=seq)
+                self._note_caption()
+            await self._translate_final_transcript(item_id, seq, text)
+        else:
+            self._resolve_seq(seq, "")
+
+    async def _handle_transcription_failed(self, msg, conn):
+        item_id = msg.get("item_id")
+        self.audio_replay.finished(item_id)
+        self.caption_parts.pop(item_id, None)
+        self._cancel_speculation(item_id)
+        seq = self.item_seqs.pop(item_id, None)
+        if seq is not None:
+            self._resolve_seq(seq, "")
+
+    async def _handle_response_created(self, msg, conn):
+        self._on_response_created(msg.get("response", {}))
+
+    async def _handle_output_text_delta(self, msg, conn):
+        request = self.response_requests.get(msg.get("response_id"))
+        if request is None:
+            return
+        for seq in request["seqs"]:
+            self.latency.mark_seq(seq, "first_delta")
+        request["partial"] += msg.get("delta") or ""
+        self._emit_partial_translation(request)
+
+    async def _handle_output_text_done(self, msg, conn):
+        request = self.response_requests.get(msg.get("response_id"))
+        if request is None:
+            return
+        request["text"] += msg.get("text") or ""
+
+    async def _handle_response_done(self, msg, conn):
+        self._on_response_done(msg.get("response", {}))
+        await self._dispatch_next_response_request()
+
+    async def _handle_error(self, msg, conn):
+        """Returns True when the connection should be dropped."""
+        err = msg.get("error", {})
+        code = err.get("code") if isinstance(err, dict) else None
+
+        # error.event_id names the rejected client event; the top-level
+        # event_id is the server's own.
+        client_event_id = err.get("event_id") if isinstance(err, dict) else None
+        request = self.inflight_requests.pop(client_event_id, None)
+        if request is not None:
+            # Our response.create was rejected: no response.created or
+            # response.done will follow for it.
+            if code == "conversation_already_has_active_response":
+                # Retry once another response finishes.
+                self.pending_response_requests.insert(0, request)
+                self.ui_msg(
+                    UIMessageType.SYS_LOG,
+                    "⏳ Response in progress, waiting before next request.",
+                )
+            else:
                 self.ui_msg(UIMessageType.SYS_LOG, f"❌ ERROR: {msg}")
-                logging.error(f"❌ OpenAI error received: {msg}")
-                break
+                translation_logger.error(f"❌ Translation request failed: {msg}")
+                self._complete_request(request, "")
+                # Its slot is free (and it may have requeued follow-ups).
+                await self._dispatch_next_response_request()
+            return False
 
-        raise asyncio.CancelledError()
+        if code == "input_audio_buffer_commit_empty":
+            # Server-side VAD may have already committed and cleared the buffer.
+            self.buffered_audio_bytes = 0
+            self.audio_replay.commit_rejected()
+            self.ui_msg(
+                UIMessageType.LOG,
+                "ℹ️ Skip empty commit (buffer already cleared).",
+            )
+            return False
+
+        self.ui_msg(UIMessageType.SYS_LOG, f"❌ ERROR: {msg}")
+        logger.error(f"❌ OpenAI error received: {msg}")
+        # It may concern the session config sent without waiting.
+        conn.configured = False
+        return True
+
+    def _mark_captioned(self, item_id, limit=256):
+        self.captioned_items[item_id] = True
+        while len(self.captioned_items) > limit:
+            self.captioned_items.popitem(last=False)
+
+    async def send_translation(self, text, seq=None):
+        if seq is None:
+            seq = self._allocate_seq()
+
+        cached = self.translation_cache.get(text, self.translation_prompt)
+        if cached is not None:
+            # No network round trip; still delivered in transcript order.
+            self._resolve_seq(seq, cached)
+            return
 
-    async def send_translation(self, text):
         await self._queue_response_request(
             mode="translation",
             instructions=self.translation_prompt,
             user_text=text,
+            seqs=[seq],
         )
 
-    async def _queue_response_request(self, mode, instructions, user_text=None):
-        async with self.response_lock:
-            request = {
-                "mode": mode,
-                "instructions": instructions,
-                "user_text": user_text,
-            }
+    def _allocate_seq(self):
+        seq = self.next_translation_seq
+        self.next_translation_seq += 1
+        return seq
+
+    def _item_seq(self, item_id):
+        """Translation seq of a transcript item, reserved on first use."""
+        seq = self.item_seqs.get(item_id)
+        if seq is None:
+            seq = self._allocate_seq()
+            if item_id is not None:
+                self.item_seqs[item_id] = seq
+                self.seq_reserved_at[seq] = time.time()
+        return seq
+
+    async def _queue_response_request(
+        self, mode, instructions, user_text=None, seqs=(), **extra
+    ):
+        request = {
+            "mode": mode,
+            "instructions": instructions,
+            "user_text": user_text,
+            "seqs": list(seqs),
+        }
+        request.update(extra)
+        self.pending_response_requests.append(request)
+        await self._dispatch_next_response_request()
 
-            if self.response_in_flight:
-                self.pending_response_requests.append(request)
-                return
+    # ==========================================================
+    # Speculative translation
+    # ==========================================================
+
+    async def _on_transcript_prefix(self, item_id, text):
+        if item_id in self.speculations:
+            return
+        if ends_sentence(text):
+            await self._speculate(item_id, text)
+            return
+
+        # Restart the stability timer on every delta.
+        timer = self.speculation_timers.pop(item_id, None)
+        if timer is not None:
+            timer.cancel()
+        self.speculation_timers[item_id] = asyncio.get_running_loop().call_later(
+            self.speculation_stable_seconds,
+            lambda: asyncio.ensure_future(self._speculate_if_stable(item_id, text)),
+        )
+
+    async def _speculate_if_stable(self, item_id, text):
+        self.speculation_timers.pop(item_id, None)
+        current = (self.caption_parts.get(item_id) or "").strip()
+        if current == text and item_id not in self.speculations:
+            await self._speculate(item_id, text)
+
+    async def _speculate(self, item_id, prefix):
+        spec = {
+            "seq": self._item_seq(item_id),
+            "prefix": prefix,
+            "sentence": ends_sentence(prefix),
+            "state": "speculating",
+            "translation": None,
+        }
+        self.speculations[item_id] = spec
+        self.ui_msg(UIMessageType.LOG, f"⚡ Speculating: {prefix}")
 
-            await self._send_response_request(request)
+        cached = self.translation_cache.get(prefix, self.translation_prompt)
+        if cached is not None:
+            spec["translation"] = cached
+            return
+        await self._queue_response_request(
+            mode="translation",
+            instructions=self.translation_prompt,
+            user_text=prefix,
+            seqs=[spec["seq"]],
+            speculation=spec,
+        )
+
+    def _cancel_speculation(self, item_id):
+        timer = self.speculation_timers.pop(item_id, None)
+        if timer is not None:
+            timer.cancel()
+        spec = self.speculations.pop(item_id, None)
+        if spec is not None:
+            spec["state"] = "stale"
+        return spec
+
+    async def _translate_final_transcript(self, item_id, seq, text):
+        spec = self._cancel_speculation(item_id)
+        if spec is None or spec["translation"] == "":
+            # No speculation, or it failed: translate normally.
+            self.translation_queue.append((seq, text))
+            await self._flush_translation_queue()
+            return
+
+        prefix = spec["prefix"]
+        if TranslationCache.normalize(text) == TranslationCache.normalize(prefix):
+            if spec["translation"] is not None:
+                self._resolve_seq(seq, spec["translation"])
+            else:
+                spec["state"] = "reuse"
+            self.ui_msg(UIMessageType.LOG, "⚡ Speculation reused")
+            return
+
+        if spec["sentence"] and text.startswith(prefix):
+            # Keep the prefix translation, translate only what came after it.
+            spec["state"] = "join"
+            self.joins[seq] = [spec["translation"], None]
+            self.ui_msg(UIMessageType.LOG, "⚡ Speculation extended")
+            await self._translate_join_part(seq, 1, text[len(prefix) :].strip())
+            return
+
+        self.ui_msg(UIMessageType.LOG, "⚡ Speculation discarded")
+        self.translation_queue.append((seq, text))
+        await self._flush_translation_queue()
+
+    async def _translate_join_part(self, seq, index, text):
+        cached = self.translation_cache.get(text, self.translation_prompt)
+        if cached is not None:
+            self._resolve_join(seq, index, cached)
+            return
+        await self._queue_response_request(
+            mode="translation",
+            instructions=self.translation_prompt,
+            user_text=text,
+            seqs=[seq],
+            join=(seq, index),
+        )
+
+    def _on_speculation_done(self, request, text):
+        spec = request["speculation"]
+        state = spec["state"]
+        if state == "speculating":
+            spec["translation"] = text
+        elif state == "reuse":
+            if text:
+                self._resolve_seq(spec["seq"], text)
+            else:
+                self._requeue_translation(request)
+        elif state == "join":
+            if text:
+                self._resolve_join(spec["seq"], 0, text)
+            else:
+                self._requeue_translation(request, join=(spec["seq"], 0))
+        # "stale": the final transcript diverged; the result is only cached.
+
+    def _requeue_translation(self, request, **extra):
+        self.pending_response_requests.insert(
+            0,
+            {
+                "mode": "translation",
+                "instructions": request["instructions"],
+                "user_text": request["user_text"],
+                "seqs": request["seqs"],
+                **extra,
+            },
+        )
+
+    def _resolve_join(self, seq, index, text):
+        parts = self.joins.get(seq)
+        if parts is None:
+            return
+        parts[index] = text
+        if None not in parts:
+            del self.joins[seq]
+            self._resolve_seq(seq, "".join(parts))
 
     async def _dispatch_next_response_request(self):
-        async with self.response_lock:
-            if self.response_in_flight or not self.pending_response_requests:
-                return
+        # Requests are only queued on a connection here (nothing is awaited),
+        # so concurrent callers cannot interleave.
+        while (
+            self.pending_response_requests
+            and len(self.inflight_requests) < self.max_concurrent_responses
+            and not self.stop_flag
+        ):
+            conn = self._pick_translation_connection()
+            if conn is None:
+                # Resumed when a translation session becomes ready.
+                break
+            request = self._batch_pending_translations(
+                self.pending_response_requests.pop(0)
+            )
+            self._send_response_request(request, conn)
+
+    def _pick_translation_connection(self):
+        """The ready translation connection with the fewest open responses."""
+        ready = [conn for conn in self.translation_pool if conn.ready]
+        if not ready:
+            return None
+        return min(
+            ready,
+            key=lambda conn: sum(
+                request["connection"] is conn
+                for request in self.inflight_requests.values()
+            ),
+        )
+
+    def _batch_pending_translations(self, request):
+        """Merge waiting single-transcript translations behind ``request``.
+
+        Only requests directly behind it in the queue are merged, so the
+        batch covers consecutive transcripts.
+        """
+        if not self._is_batchable(request, request["instructions"]):
+            return request
+
+        parts = [request]
+        pending = self.pending_response_requests
+        while (
+            pending
+            and len(parts) < self.max_batch_segments
+            and self._is_batchable(pending[0], request["instructions"])
+        ):
+            parts.append(pending.pop(0))
+        if len(parts) == 1:
+            return request
+
+        # The marker rules are part of the translation session instructions.
+        return {
+            "mode": "translation",
+            "instructions": request["instructions"],
+            "user_text": "\n".join(
+                f"[[{i}]] {part['user_text']}" for i, part in enumerate(parts, 1)
+            ),
+            "seqs": [part["seqs"][0] for part in parts],
+            "parts": parts,
+        }
 
-            request = self.pending_response_requests.pop(0)
-            await self._send_response_request(request)
+    @staticmethod
+    def _is_batchable(request, instructions):
+        return (
+            request["mode"] == "translation"
+            and request["instructions"] == instructions
+            and len(request.get("seqs", [])) == 1
+            and not request.get("no_batch")
+            and not request.get("speculation")
+            and not request.get("join")
+        )
 
-    async def _send_response_request(self, request):
+    def _send_response_request(self, request, conn):
         user_text = request.get("user_text")
-        instructions = request["instructions"]
+        self.response_counter += 1
+        event_id = f"resp_{self.response_counter}"
 
+        # Instructions come from the translation session config.
         response_body = {
             "output_modalities": ["text"],
-            "instructions": instructions,
+            # Lets response.created be matched back to this request.
+            "metadata": {"event_id": event_id},
         }
 
         # Keep translation isolated from default conversation so prior turns do not
         # leak style/language back into translated output.
+        # Out-of-band responses (conversation "none") may run concurrently.
         if user_text:
             response_body["conversation"] = "none"
             response_body["input"] = [
@@ -549,24 +1270,227 @@ class RealtimeAPIClient(UIMessageMixin):
                 }
             ]
 
-        await self.ws.send(
-            json.dumps(
-                {
-                    "type": "response.create",
-                    "response": response_body,
-                }
+        request["event_id"] = event_id
+        request["text"] = ""
+        request["partial"] = ""
+        request["sent_at"] = time.time()
+        request["connection"] = conn
+        self.inflight_requests[event_id] = request
+        for seq in request["seqs"]:
+            self.latency.mark_seq(seq, "response_sent")
+        conn.post(
+            {
+                "type": "response.create",
+                "event_id": event_id,
+                "response": response_body,
+            }
+        )
+
+    def _requeue_connection_requests(self, conn):
+        """Requeue responses lost with ``conn``'s socket, oldest first."""
+        lost = sorted(
+            (r for r in self.inflight_requests.values() if r["connection"] is conn),
+            key=lambda r: r.get("seqs") or [-1],
+        )
+        for request in lost:
+            self.inflight_requests.pop(request["event_id"], None)
+        for response_id, request in list(self.response_requests.items()):
+            if request["connection"] is conn:
+                del self.response_requests[response_id]
+        self.pending_response_requests[:0] = lost
+
+    def _on_response_created(self, response):
+        metadata = response.get("metadata") or {}
+        request = self.inflight_requests.get(metadata.get("event_id"))
+        if request is not None and response.get("id"):
+            self.response_requests[response["id"]] = request
+
+    def _on_response_done(self, response):
+        request = self.response_requests.pop(response.get("id"), None)
+        if request is None:
+            metadata = response.get("metadata") or {}
+            request = self.inflight_requests.get(metadata.get("event_id"))
+        if request is None:
+            return
+        self.inflight_requests.pop(request["event_id"], None)
+        for seq in request["seqs"]:
+            self.latency.mark_seq(seq, "response_done")
+
+        status = response.get("status")
+        if status not in (None, "completed"):
+            self.ui_msg(UIMessageType.SYS_LOG, f"⚠️ Translation {status}")
+        self._complete_request(request, request["text"].strip())
+
+    def _complete_request(self, request, text):
+        if text and (request.get("speculation") or request.get("join")):
+            self.translation_cache.put(
+                request["user_text"], request["instructions"], text
+            )
+        if request.get("speculation"):
+            self._on_speculation_done(request, text)
+            return
+        if request.get("join"):
+            self._resolve_join(*request["join"], text)
+            return
+
+        seqs = request.get("seqs", [])
+        if len(seqs) > 1 and text:
+            texts = split_segments(text, len(seqs))
+            if texts is None:
+                # The model did not keep the markers: translate one by one.
+                translation_logger.warning(
+                    f"⚠️ Batch translation lost its markers: {text}"
+                )
+                for part in request["parts"]:
+                    part["no_batch"] = True
+                self.pending_response_requests[:0] = request["parts"]
+                return
+        else:
+            texts = [text] * len(seqs)
+
+        for part, translated in zip(request.get("parts", [request]), texts):
+            self.translation_cache.put(
+                part["user_text"], part["instructions"], translated
             )
+        for seq, translated in zip(seqs, texts):
+            self.seq_reserved_at.pop(seq, None)
+            if seq >= self.next_emit_seq:  # else it was skipped as timed out
+                self.translation_results[seq] = translated
+        self._emit_translations()
+
+    def _resolve_seq(self, seq, text):
+        self.seq_reserved_at.pop(seq, None)
+        if seq >= self.next_emit_seq:  # else it was skipped as timed out
+            self.translation_results[seq] = text
+        self._emit_translations()
+
+    async def _save_translation_cache(self):
+        stats = self.translation_cache.stats()
+        self.ui_msg(
+            UIMessageType.LOG,
+            f"💾 Translation cache: hits={stats['hits']} misses={stats['misses']} "
+            f"size={stats['size']} hit_rate={stats['hit_rate']:.0%}",
         )
-        self.response_in_flight = True
+        await asyncio.to_thread(self.save_translation_cache)
+
+    def _emit_translations(self):
+        """Emit finished translations in transcript order."""
+        emitted = False
+        for seq in [s for s in self.translation_results if s < self.next_emit_seq]:
+            del self.translation_results[seq]  # arrived after being skipped
+        while True:
+            seq = self.next_emit_seq
+            if seq in self.translation_results:
+                text = self.translation_results.pop(seq)
+            elif self.translation_results and self._is_stalled(seq):
+                # A later translation is ready but this one never finished.
+                logger.warning(f"⌛ Translation #{seq} timed out; skipping")
+                self._abandon_seq(seq)
+                text = ""
+            else:
+                break
+            self.next_emit_seq += 1
+            emitted = True
+            if text:
+                self.ui_msg(UIMessageType.TRANSLATED, text, seq=seq)
+            if self.latency.finish(seq, shown=bool(text)) and text:
+                self.ui_msg(UIMessageType.LATENCY, self.latency.summary())
+
+        if emitted:
+            # The new head may already be streaming; show what it has so far.
+            for request in self.response_requests.values():
+                if request["partial"]:
+                    self._emit_partial_translation(request)
+
+    def _emit_partial_translation(self, request):
+        """Stream a translation while it is the next one due on screen."""
+        seqs = request.get("seqs", [])
+        if self.next_emit_seq not in seqs:
+            return
+        if len(seqs) == 1:
+            text = request["partial"]
+        else:
+            text = partial_segment(
+                request["partial"], seqs.index(self.next_emit_seq) + 1
+            )
+        text = text.strip()
+        if text:
+            self.ui_msg(UIMessageType.TRANSLATED_PARTIAL, text)
+
+    def _abandon_seq(self, seq):
+        """Forget the requests of a skipped seq so they free their slots."""
+        self.seq_reserved_at.pop(seq, None)
+        self.joins.pop(seq, None)
+        for event_id, request in list(self.inflight_requests.items()):
+            if seq in request.get("seqs", []):
+                del self.inflight_requests[event_id]
+        for response_id, request in list(self.response_requests.items()):
+            if seq in request.get("seqs", []):
+                del self.response_requests[response_id]
+        self.pending_response_requests[:] = [
+            request
+            for request in self.pending_response_requests
+            if seq not in request.get("seqs", [])
+        ]
+        if self.loop is not None and self.loop.is_running():
+            # A freed slot may let a waiting request go out.
+            self.loop.call_soon(
+                lambda: asyncio.ensure_future(self._dispatch_next_response_request())
+            )
+
+    def _is_stalled(self, seq):
+        if seq >= self.next_translation_seq:
+            # Not allocated yet: nothing is late.
+            return False
+        reserved_at = self.seq_reserved_at.get(seq)
+        if reserved_at is not None and seq in self.item_seqs.values():
+            # Committed audio still waiting for its transcript.
+            return time.time() - reserved_at > self.translation_timeout
+        for request in self.inflight_requests.values():
+            if seq in request.get("seqs", []):
+                return time.time() - request["sent_at"] > self.translation_timeout
+        # Not in flight: still pending (or queued) means it is simply waiting.
+        for request in self.pending_response_requests:
+            if seq in request.get("seqs", []):
+                return False
+        return not any(s == seq for s, _ in self.translation_queue)
 
     async def _flush_translation_queue(self):
         async with self.translation_lock:
             while self.translation_queue and not self.stop_flag:
-                next_text = self.translation_queue.pop(0)
+                seq, next_text = self.translation_queue.pop(0)
                 try:
-                    await self.send_translation(next_text)
+                    await self.send_translation(next_text, seq)
                 except Exception as e:
                     # Restore order on transient send failures.
-                    self.translation_queue.insert(0, next_text)
+                    self.translation_queue.insert(0, (seq, next_text))
                     self.ui_msg(UIMessageType.SYS_LOG, f"❌ Send error:{e}")
                     break
+
+
+def ends_sentence(text):
+    return bool(SENTENCE_END.search(text)) and not NOT_SENTENCE_END.search(text)
+
+
+def split_segments(text, count):
+    """Split a ``[[n]]``-marked batch translation into ``count`` texts.
+
+    Returns None unless every marker from 1 to ``count`` is present.
+    """
+    pieces = SEGMENT_MARKER.split(text)
+    found = {}
+    for number, body in zip(pieces[1::2], pieces[2::2]):
+        found[int(number)] = body.strip()
+    if sorted(found) != list(range(1, count + 1)):
+        return None
+    return [found[i] for i in range(1, count + 1)]
+
+
+def partial_segment(text, number):
+    """Text streamed so far for segment ``number`` of a batch translation."""
+    pieces = SEGMENT_MARKER.split(text)
+    for marker, body in zip(pieces[1::2], pieces[2::2]):
+        if int(marker) == number:
+            # Hide a half-streamed "[[" of the next marker.
+            return body.split("[[")[0]
+    return ""
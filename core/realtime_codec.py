@@ -0,0 +1,65 @@
+import asyncio
+import base64
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+# Realtime API events are JSON text frames; websockets sends ``str`` as text,
+# so every encoder here returns ``str``.
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# base64 output never needs JSON escaping, so appends are built by
+# concatenation instead of serializing a dict per block.
+_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":"'
+_APPEND_SUFFIX = '"}'
+
+# Payloads at least this large are encoded in slices, yielding to the event
+# loop in between. (binascii holds the GIL, so a worker thread would not
+# keep the loop any more responsive.)
+INCREMENTAL_BASE64_BYTES = 128 * 1024
+_SLICE_BYTES = 48 * 1024  # a multiple of 3: slices encode without padding
+
+
+if orjson is not None:
+
+    def dumps(message):
+        return orjson.dumps(message).decode("utf-8")
+
+    loads = orjson.loads
+
+else:
+    dumps = _encoder.encode
+    loads = json.loads
+
+
+def backend():
+    return "orjson" if orjson is not None else "json"
+
+
+def encode_append(pcm_bytes):
+    """input_audio_buffer.append event for ``pcm_bytes`` as a JSON string."""
+    audio = base64.b64encode(pcm_bytes).decode("ascii")
+    return _APPEND_PREFIX + audio + _APPEND_SUFFIX
+
+
+async def encode_append_async(pcm_bytes):
+    """``encode_append`` that does not hold the loop on large payloads."""
+    if len(pcm_bytes) < INCREMENTAL_BASE64_BYTES:
+        return encode_append(pcm_bytes)
+
+    view = memoryview(pcm_bytes)
+    parts = [_APPEND_PREFIX]
+    for start in range(0, len(view), _SLICE_BYTES):
+        parts.append(
+            base64.b64encode(view[start : start + _SLICE_BYTES]).decode("ascii")
+        )
+        await asyncio.sleep(0)
+    parts.append(_APPEND_SUFFIX)
+    return "".join(parts)
+
+
+COMMIT_MESSAGE = dumps({"type": "input_audio_buffer.commit"})
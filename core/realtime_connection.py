@@ -0,0 +1,158 @@
+import asyncio
+import random
+import time
+
+import websockets
+
+from core import realtime_codec
+from core.log_manager import get_logger
+
+logger = get_logger("realtime")
+
+
+class RealtimeConnection:
+    """One Realtime API websocket session.
+
+    ``open()`` connects, applies ``session`` with session.update and waits for
+    session.updated. Once a session config has been accepted, reopening only
+    sends the session.update and returns at once: the server applies events
+    in order, so anything sent afterwards already uses it. Messages queued
+    with ``post()`` are written in order by ``run_sender()``, so callers never
+    wait on a busy socket.
+    """
+
+    def __init__(
+        self,
+        name,
+        url,
+        session,
+        backoff_base=0.5,
+        backoff_cap=20.0,
+        ping_interval=15.0,
+        ping_timeout=10.0,
+    ):
+        self.name = name
+        self.url = url
+        self.session = session
+        self.ws = None
+        self.ready = False
+        # True once the server accepted ``session``; cleared on an unexpected
+        # error so the next open() confirms the config again.
+        self.configured = False
+        self.outbox = asyncio.Queue()
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.failures = 0
+        # Heartbeats keep idle (pre-warmed) sessions open and reveal dead ones.
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+
+    async def open(self, api_key, timeout_sec=10):
+        self.ready = False
+        headers = [("Authorization", f"Bearer {api_key}")]
+        self.ws = await websockets.connect(
+            self.url,
+            extra_headers=headers,
+            ping_interval=self.ping_interval,
+            ping_timeout=self.ping_timeout,
+        )
+        logger.info(f"🔗 {self.name}: WS Connected")
+
+        # It is not explicitly stated whether you must wait for session.created
+        # before sending session.update, so just ignore session.created.
+        await self.send({"type": "session.update", "session": self.session})
+
+        if not self.configured:
+            # Trigger subsequent events only after confirming session.updated
+            await self._wait_for_session_updated(timeout_sec)
+            self.configured = True
+        self.ready = True
+        self.failures = 0
+
+    def next_backoff(self):
+        """Jittered exponential delay before the next reconnect attempt."""
+        delay = min(self.backoff_cap, self.backoff_base * 2**self.failures)
+        self.failures += 1
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def close(self):
+        self.ready = False
+        while not self.outbox.empty():
+            self.outbox.get_nowait()
+        if self.ws is None:
+            return
+        try:
+            # A graceful close avoids noisy close-frame errors.
+            await self.ws.close(code=1000)
+        except Exception:
+            try:
+                self.ws.fail_connection()
+            except Exception:
+                pass
+
+    async def send(self, message):
+        """Send an event dict (or an already encoded JSON string)."""
+        if not isinstance(message, str):
+            message = realtime_codec.dumps(message)
+        await self.ws.send(message)
+
+    async def messages(self):
+        """Incoming frames until the socket closes."""
+        try:
+            async for raw in self.ws:
+                yield raw
+        except websockets.ConnectionClosed:
+            return
+
+    def post(self, message):
+        """Queue ``message`` for ``run_sender()``."""
+        self.outbox.put_nowait(message)
+
+    async def run_sender(self):
+        while True:
+            message = await self.outbox.get()
+            await self.send(message)
+
+    def update_session(self, session):
+        """Replace the session config, applying it now if connected."""
+        self.session = session
+        if self.ready:
+            self.post({"type": "session.update", "session": session})
+
+    def backlog(self):
+        """Bytes written to the websocket transport but not yet sent."""
+        transport = getattr(self.ws, "transport", None)
+        if transport is None:
+            return 0
+        try:
+            return transport.get_write_buffer_size()
+        except Exception:
+            return 0
+
+    async def _wait_for_session_updated(self, timeout_sec=10):
+        deadline = time.time() + timeout_sec
+        while time.time() < deadline:
+            try:
+                raw = await asyncio.wait_for(self.ws.recv(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
+
+            msg = realtime_codec.loads(raw)
+            t = msg.get("type")
+
+            if t == "session.updated":
+                logger.info(f"✅ {self.name}: SESSION UPDATED:{msg.get('session')}")
+                return
+
+            if t == "error":
+                err = msg.get("error", msg)
+                code = ""
+                if isinstance(err, dict):
+                    code = err.get("code", "")
+                if code in {"unknown_parameter", "missing_required_parameter"}:
+                    raise ValueError(f"session.update failed: {err}")
+                raise RuntimeError(f"session.update failed: {err}")
+
+            logger.info(f"↪ {self.name}: pre-ready event: {t}")
+
+        raise TimeoutError("Timeout waiting for session.updated")
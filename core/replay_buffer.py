@@ -0,0 +1,105 @@
+from collections import OrderedDict, deque
+from itertools import chain
+
+
+class ReplayBuffer:
+    """Local copy of audio the transcription session has not finished with.
+
+    Appended PCM is kept until the transcript of its utterance arrives, so
+    after a reconnect it can be replayed into the new session instead of
+    being lost with the old one. Utterances move through three stages:
+
+    - open: appended, not committed yet
+    - sent: commit written, input_audio_buffer.committed not seen yet
+    - items: committed as ``item_id``, transcript still pending
+
+    At most ``max_bytes`` are kept; the oldest utterances lose their audio
+    first (they stay listed, with no chunks, until they are finished).
+    """
+
+    def __init__(self, max_bytes=16000 * 2 * 30):
+        self.max_bytes = max_bytes
+        self._open = []
+        self._sent = deque()
+        self._items = OrderedDict()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def pending(self):
+        """True while a commit still waits for its committed event or transcript."""
+        return bool(self._sent or self._items)
+
+    def append(self, pcm_bytes):
+        # Copy: capture ring views are overwritten long before some
+        # utterances finish.
+        chunk = bytes(pcm_bytes)
+        self._open.append(chunk)
+        self._size += len(chunk)
+        self._trim()
+
+    def commit(self, seq=None, trace=None):
+        """The open utterance was committed; ``seq`` keeps a reserved slot."""
+        self._sent.append({"chunks": self._open, "seq": seq, "trace": trace})
+        self._open = []
+
+    def committed(self, item_id):
+        """Match a committed event to the oldest sent commit.
+
+        Returns ``(seq, trace)`` as given to ``commit()``: the translation seq
+        is only set for replayed utterances.
+        """
+        if not self._sent:
+            return None, None
+        utterance = self._sent.popleft()
+        if item_id is not None:
+            self._items[item_id] = utterance
+        return utterance["seq"], utterance["trace"]
+
+    def commit_rejected(self):
+        """The oldest sent commit failed (e.g. empty buffer)."""
+        if self._sent:
+            self._drop(self._sent.popleft())
+
+    def finished(self, item_id):
+        """The transcript for ``item_id`` arrived (or failed for good)."""
+        utterance = self._items.pop(item_id, None)
+        if utterance is not None:
+            self._drop(utterance)
+
+    def take(self):
+        """Empty the buffer for replay.
+
+        Returns ``(utterances, open_chunks)``: committed utterances oldest
+        first as ``(item_id or None, chunks, seq, trace)``, and the PCM chunks
+        of the utterance still being recorded.
+        """
+        utterances = [
+            (item_id, u["chunks"], u["seq"], u["trace"])
+            for item_id, u in self._items.items()
+        ]
+        utterances += [(None, u["chunks"], u["seq"], u["trace"]) for u in self._sent]
+        open_chunks = self._open
+        self._items.clear()
+        self._sent.clear()
+        self._open = []
+        self._size = 0
+        return utterances, open_chunks
+
+    def _drop(self, utterance):
+        self._size -= sum(len(chunk) for chunk in utterance["chunks"])
+
+    def _trim(self):
+        while self._size > self.max_bytes:
+            # Committed utterances still pair with transcripts (and keep their
+            # seqs for take()), sent ones with committed events: only empty them.
+            utterance = next(
+                (u for u in chain(self._items.values(), self._sent) if u["chunks"]),
+                None,
+            )
+            if utterance is not None:
+                self._drop(utterance)
+                utterance["chunks"] = []
+                continue
+            self._size -= len(self._open.pop(0))
@@ -0,0 +1,68 @@
+import datetime
+import shutil
+import tempfile
+import threading
+from collections import deque
+
+
+class TranscriptHistory:
+    """Session transcript with a bounded in-memory tail.
+
+    The newest ``max_entries`` lines stay in memory (and in the UI); older
+    ones are moved to an anonymous temporary file, which the OS removes when
+    the app exits. ``export()`` writes the whole session, spilled lines
+    first, so memory use stays flat however long the session runs.
+    """
+
+    def __init__(self, max_entries=500):
+        self.max_entries = max_entries
+        self._entries = deque()
+        self._spill = None
+        self.spilled = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.spilled + len(self._entries)
+
+    def add(self, icon, text, ts):
+        """Record one line; returns it formatted for display."""
+        line = self.format(icon, text, ts)
+        with self._lock:
+            self._entries.append(line)
+            while len(self._entries) > self.max_entries:
+                self._spill_line(self._entries.popleft())
+        return line
+
+    @staticmethod
+    def format(icon, text, ts):
+        timestamp = datetime.datetime.fromtimestamp(ts).strftime("%H:%M:%S")
+        # One line per entry keeps widget trimming to whole entries.
+        return f"[{timestamp}]{icon}{' '.join(text.splitlines())}"
+
+    def recent(self):
+        with self._lock:
+            return list(self._entries)
+
+    def export(self, path):
+        """Write every line of the session to ``path``."""
+        with self._lock:
+            with open(path, "w", encoding="utf-8") as out:
+                if self._spill is not None:
+                    self._spill.flush()
+                    self._spill.seek(0)
+                    shutil.copyfileobj(self._spill, out)
+                    self._spill.seek(0, 2)
+                for line in self._entries:
+                    out.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+
+    def _spill_line(self, line):
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._spill.write(line + "\n")
+        self.spilled += 1
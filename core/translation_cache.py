@@ -0,0 +1,95 @@
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from core.config_filestorage import FileStorage, atomic_write_text
+from core.log_manager import get_logger
+
+logger = get_logger("translation")
+
+
+class TranslationCache:
+    """LRU cache of finished translations.
+
+    Entries are keyed on the normalized transcript plus a hash of the prompt
+    that produced them, so editing the translation prompt never serves stale
+    output. With ``persistent=True`` the cache is loaded from and saved to
+    ``translation_cache.json`` next to the FileStorage config file.
+    """
+
+    FILE_NAME = "translation_cache.json"
+
+    def __init__(self, max_entries=2000, persistent=False):
+        self.max_entries = max_entries
+        self.path = FileStorage().path.with_name(self.FILE_NAME) if persistent else None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._dirty = False
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self.load()
+
+    @staticmethod
+    def normalize(text):
+        return re.sub(r"\s+", " ", text).strip().casefold()
+
+    @staticmethod
+    def _key(text, prompt):
+        prompt_hash = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:12]
+        return f"{prompt_hash}:{TranslationCache.normalize(text)}"
+
+    def get(self, text, prompt):
+        key = self._key(text, prompt)
+        with self._lock:
+            translation = self._entries.get(key)
+            if translation is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return translation
+
+    def put(self, text, prompt, translation):
+        if not text or not translation:
+            return
+        key = self._key(text, prompt)
+        with self._lock:
+            self._entries[key] = translation
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable translation cache: {e}")
+            return
+        with self._lock:
+            # Stored oldest first, so replaying keeps the LRU order.
+            for key, translation in entries[-self.max_entries :]:
+                self._entries[key] = translation
+
+    def save(self):
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = list(self._entries.items())
+            self._dirty = False
+        atomic_write_text(self.path, json.dumps(entries, ensure_ascii=False))
@@ -0,0 +1,88 @@
+import threading
+import time
+
+from core.message_types import UIMessageType
+
+
+class UIBus:
+    """Thread-safe ui_queue that coalesces status-like messages.
+
+    Messages of a *channel* type (input level, partial caption/translation,
+    status line, latency) only matter in their newest version, so a new one
+    replaces the pending one. All other messages are *events* and are kept in
+    order. Every message is stamped with ``ts`` (``time.time()`` when posted)
+    unless it already has one.
+
+    The consumer registers a waker with ``set_waker()``. It is called, from
+    the posting thread, when the bus goes from empty to pending and not again
+    until the next ``drain()``, so an idle UI is never woken. It must not
+    block (the poster may be the audio or asyncio thread). A waker that
+    returns False could not wake the consumer; the next message tries again.
+    """
+
+    CHANNELS = {
+        UIMessageType.VOLUME: "volume",
+        UIMessageType.CAPTION_PARTIAL: "caption",
+        UIMessageType.TRANSLATED_PARTIAL: "translation",
+        UIMessageType.LOG: "status",
+        UIMessageType.SYS_LOG: "status",
+        UIMessageType.LATENCY: "latency",
+    }
+    # Events that also set a channel's widget: a value posted before them is
+    # stale and must not be rendered after them.
+    SUPERSEDES = {
+        UIMessageType.CAPTION: "caption",
+        UIMessageType.TRANSLATED: "translation",
+        UIMessageType.AUDIO_STOPPED: "volume",
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = []
+        self._values = {}
+        self._waker = None
+        self._wake_pending = False
+        self.posted = 0
+        self.coalesced = 0
+
+    def put(self, msg):
+        msg.setdefault("ts", time.time())
+        msg_type = msg.get("type")
+        channel = self.CHANNELS.get(msg_type)
+        with self._lock:
+            self.posted += 1
+            if channel is not None:
+                if channel in self._values:
+                    self.coalesced += 1
+                self._values[channel] = msg
+            else:
+                superseded = self.SUPERSEDES.get(msg_type)
+                if self._values.pop(superseded, None) is not None:
+                    self.coalesced += 1
+                self._events.append(msg)
+            wake = self._waker if not self._wake_pending else None
+            self._wake_pending = True
+        if wake is not None:
+            self._wake(wake)
+
+    def set_waker(self, waker):
+        """Call ``waker()`` whenever messages become pending (now, if any are)."""
+        with self._lock:
+            self._waker = waker
+            pending = bool(self._events or self._values)
+            self._wake_pending = pending
+        if pending:
+            self._wake(waker)
+
+    def _wake(self, waker):
+        if waker() is False:
+            with self._lock:
+                self._wake_pending = False
+
+    def drain(self):
+        """Take everything pending as ``(events in order, {channel: newest msg})``."""
+        with self._lock:
+            events, self._events = self._events, []
+            values, self._values = self._values, {}
+            self._wake_pending = False
+        return events, values
@@ -0,0 +1,127 @@
+from enum import Enum
+
+import numpy as np
+
+
+class VADEvent(Enum):
+    SPEECH_START = "speech_start"
+    SPEECH_END = "speech_end"
+
+
+class VoiceActivityDetector:
+    """Base class for local voice-activity detectors.
+
+    Detectors are fed every captured block in order (including the quiet ones
+    that are not uploaded) and return a VADEvent when an utterance starts or
+    ends. Durations are measured in audio time, not wall-clock time, so the
+    same detector works on live capture and on recorded files.
+    """
+
+    in_speech = False
+
+    def process(self, pcm, volume):
+        """Feed one int16 PCM block (bytes-like); return a VADEvent or None."""
+        raise NotImplementedError
+
+    def reset(self):
+        self.in_speech = False
+
+
+class EnergySpectralVAD(VoiceActivityDetector):
+    """Block-level VAD on energy, speech-band ratio and spectral flatness.
+
+    A block counts as speech when its mean amplitude clears both the absolute
+    ``energy_threshold`` and ``snr`` times the tracked noise level, most of its
+    energy sits in the speech band, and its spectrum is not flat (noise-like).
+    ``min_speech_ms`` of consecutive speech blocks open an utterance;
+    ``hangover_ms`` of non-speech blocks close it.
+    """
+
+    def __init__(
+        self,
+        samplerate=16000,
+        energy_threshold=10,
+        snr=2.0,
+        speech_band=(80, 4000),
+        min_band_ratio=0.6,
+        max_flatness=0.5,
+        min_speech_ms=200,
+        hangover_ms=300,
+        noise_adapt=0.05,
+    ):
+        self.samplerate = samplerate
+        self.energy_threshold = energy_threshold
+        self.snr = snr
+        self.speech_band = speech_band
+        self.min_band_ratio = min_band_ratio
+        self.max_flatness = max_flatness
+        self.min_speech_ms = min_speech_ms
+        self.hangover_ms = hangover_ms
+        self.noise_adapt = noise_adapt
+
+        self._nfft = 0
+        self._band = slice(0, 0)
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.noise_level = None
+        self._speech_ms = 0.0
+        self._silence_ms = 0.0
+
+    def process(self, pcm, volume):
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        if not len(samples):
+            return None
+        block_ms = len(samples) * 1000 / self.samplerate
+        speech = self.is_speech(samples, volume)
+
+        if not speech:
+            if self.noise_level is None or volume < self.noise_level:
+                self.noise_level = volume
+            else:
+                self.noise_level += self.noise_adapt * (volume - self.noise_level)
+
+        if not self.in_speech:
+            self._speech_ms = self._speech_ms + block_ms if speech else 0.0
+            if self._speech_ms >= self.min_speech_ms:
+                self.in_speech = True
+                self._silence_ms = 0.0
+                return VADEvent.SPEECH_START
+            return None
+
+        self._silence_ms = 0.0 if speech else self._silence_ms + block_ms
+        if self._silence_ms >= self.hangover_ms:
+            self.in_speech = False
+            self._speech_ms = 0.0
+            return VADEvent.SPEECH_END
+        return None
+
+    def is_speech(self, samples, volume):
+        if volume < self.energy_threshold:
+            return False
+        if self.noise_level is not None and volume < self.noise_level * self.snr:
+            return False
+
+        power = self._power_spectrum(samples)
+        total = power.sum()
+        if total <= 0:
+            return False
+        band = power[self._band]
+        if band.sum() / total < self.min_band_ratio:
+            return False
+
+        # Geometric / arithmetic mean of the band power: about 0.56 for white
+        # noise, far lower for voiced speech.
+        flatness = np.exp(np.log(band + 1e-10).mean()) / (band.mean() + 1e-10)
+        return flatness <= self.max_flatness
+
+    def _power_spectrum(self, samples):
+        n = len(samples)
+        if n != self._nfft:
+            self._nfft = n
+            freqs = np.fft.rfftfreq(n, 1 / self.samplerate)
+            low, high = np.searchsorted(freqs, self.speech_band)
+            self._band = slice(low, high)
+        spectrum = np.fft.rfft(samples.astype(np.float32))
+        return spectrum.real**2 + spectrum.imag**2
@@ -1,11 +1,20 @@
 import logging
+import sys
 from core.log_manager import setup_logging
-import ui.tk
 
 if __name__ == "__main__":
     setup_logging()
     try:
-        ui.tk.action_open_ui()
+        if "--headless" in sys.argv:
+            # JSON lines on stdout; Tk is never imported.
+            from core.pipeline import main
+
+            sys.argv.remove("--headless")
+            main()
+        else:
+            import ui.tk
+
+            ui.tk.action_open_ui()
     except KeyboardInterrupt:
         logging.info(
             "🛑 Stopped by user",
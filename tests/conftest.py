@@ -0,0 +1,35 @@
+import pytest
+
+from core.config_manager import ConfigManager
+from core.config_storage import StorageBackend
+
+
+class MemoryStorage(StorageBackend):
+    def load(self):
+        return {"TRANSLATION_CACHE_PERSIST": False, "LATENCY_TRACE": False}
+
+    def save(self, data):
+        pass
+
+    def get_secret(self, key):
+        return "sk-test"
+
+
+if ConfigManager._instance is None:
+    ConfigManager.configure(MemoryStorage())
+
+
+class FakeConnection:
+    ready = True
+    configured = True
+
+    def __init__(self):
+        self.sent = []
+
+    def post(self, event):
+        self.sent.append(event)
+
+
+@pytest.fixture
+def connection():
+    return FakeConnection()
@@ -0,0 +1,68 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+import core.audio_manager as audio_manager
+from core.audio_manager import AudioStreamManager
+
+
+class FakeInputStream:
+    def __init__(self, **kwargs):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(
+        audio_manager, "sd", type("sd", (), {"InputStream": FakeInputStream})
+    )
+    manager = AudioStreamManager()
+    manager.disable_noise_reduction()
+    yield manager
+    manager.stop()
+    manager.detach_consumer()
+
+
+def capture(manager, blocks, level=0.1):
+    indata = np.full((manager.blocksize, 1), level, dtype=np.float32)
+    for _ in range(blocks):
+        manager.default_audio_callback(indata, manager.blocksize, None, None)
+
+
+def test_first_consumer_gets_audio_captured_before_it_attached(manager):
+    capture(manager, 3)  # before the mic session: not part of it
+    manager.start()
+    capture(manager, 5)
+    loop = asyncio.new_event_loop()
+    try:
+        manager.attach_consumer(loop)
+        assert len(manager.read_blocks()) == 5
+
+        # A later fresh consumer starts from the newest block.
+        manager.detach_consumer()
+        capture(manager, 2)
+        manager.attach_consumer(loop)
+        assert manager.read_blocks() == []
+    finally:
+        loop.close()
+
+
+def test_early_audio_is_bounded_by_the_ring(manager):
+    manager.start()
+    capture(manager, manager.ring_blocks + 10)
+    loop = asyncio.new_event_loop()
+    try:
+        manager.attach_consumer(loop)
+        assert len(manager.read_blocks()) == manager.ring_blocks - 1
+    finally:
+        loop.close()
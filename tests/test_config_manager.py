@@ -0,0 +1,28 @@
+from core.config_envstorage import EnvStorage
+from core.config_manager import ConfigManager
+
+
+def fresh_manager(monkeypatch, backend):
+    monkeypatch.setattr(ConfigManager, "_instance", None)
+    monkeypatch.setattr(ConfigManager, "_backend", None)
+    ConfigManager.configure(backend)
+    manager = ConfigManager()
+    monkeypatch.setattr(manager, "SAVE_DELAY", 3600)
+    return manager
+
+
+def test_env_prompt_is_used(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("PEPE_PROMPT", "Translate into French.")
+    manager = fresh_manager(monkeypatch, EnvStorage())
+    assert manager.get_prompt(default="default") == "Translate into French."
+
+    manager.set_prompt("Translate into German.")
+    assert manager.get_prompt() == "Translate into German."
+
+
+def test_prompt_falls_back_to_config_file(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("PEPE_PROMPT", raising=False)
+    manager = fresh_manager(monkeypatch, EnvStorage())
+    assert manager.get_prompt(default="default") == "default"
@@ -0,0 +1,22 @@
+import json
+
+from core.latency_trace import LatencyTracer
+
+
+def test_finished_traces_are_written_by_the_background_writer(tmp_path, monkeypatch):
+    monkeypatch.setenv("PEPE_LOG_MAX_BYTES", "400")
+    monkeypatch.setenv("PEPE_LOG_BACKUPS", "1")
+    path = tmp_path / "latency.jsonl"
+    tracer = LatencyTracer(path=path)
+    for seq in range(10):
+        trace = tracer.begin(captured_at=100.0 + seq)
+        tracer.bind(seq, trace)
+        tracer.mark(trace, "committed", at=100.5 + seq)
+        tracer.finish(seq)
+    tracer.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines and json.loads(lines[-1])["seq"] == 9
+    # Rotated instead of growing without bound.
+    assert (tmp_path / "latency.jsonl.1").exists()
+    assert not (tmp_path / "latency.jsonl.2").exists()
@@ -0,0 +1,16 @@
+import logging
+
+from core.message_types import UIMessageMixin, UIMessageType
+
+
+class Source(UIMessageMixin):
+    log_subsystem = "ui"
+    ui_queue = None
+
+
+def test_partials_are_mirrored_to_the_log_at_debug_only(caplog):
+    with caplog.at_level(logging.INFO, logger="pepe.ui"):
+        Source().ui_msg(UIMessageType.CAPTION_PARTIAL, "hello wor")
+        Source().ui_msg(UIMessageType.CAPTION, "hello world")
+        Source().ui_msg(UIMessageType.TRANSLATED_PARTIAL, "こんにち")
+    assert [r.getMessage() for r in caplog.records] == ["[caption] hello world"]
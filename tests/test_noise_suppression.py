@@ -0,0 +1,47 @@
+import numpy as np
+
+from core.noise_suppression import SpectralGate
+
+SAMPLERATE = 16000
+BLOCKSIZE = 1600
+
+
+def denoise(signal):
+    gate = SpectralGate(BLOCKSIZE)
+    out = np.zeros(len(signal))
+    block = np.empty(BLOCKSIZE, dtype=np.int16)
+    for start in range(0, len(signal) - BLOCKSIZE + 1, BLOCKSIZE):
+        gate.process(signal[start : start + BLOCKSIZE].astype(np.float32), block)
+        out[start : start + BLOCKSIZE] = block
+    return np.concatenate([out[gate.hop :], np.zeros(gate.hop)])  # undo the lag
+
+
+def kept(out, clean, seconds):
+    part = slice(seconds[0] * SAMPLERATE, seconds[1] * SAMPLERATE)
+    return np.dot(out[part], clean[part]) / np.dot(clean[part], clean[part])
+
+
+def voiced(seconds, f0=150):
+    t = np.arange(seconds * SAMPLERATE) / SAMPLERATE
+    voice = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 6))
+    return 5000 * voice * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t) ** 2)
+
+
+def test_long_utterances_keep_their_level():
+    rng = np.random.default_rng(0)
+    pause = np.zeros(SAMPLERATE)
+    clean = np.concatenate([voiced(4), pause, voiced(4), pause])
+    out = denoise(clean + rng.normal(0, 300, len(clean)))
+
+    assert kept(out, clean, (0, 4)) > 0.9  # speech before any noise was heard
+    assert kept(out, clean, (5, 9)) > 0.9
+    assert kept(out, clean, (8, 9)) > 0.9  # no decay within the utterance
+    assert np.std(out[9 * SAMPLERATE :]) < 0.5 * 300  # the pause is denoised
+
+
+def test_steady_tone_is_not_learned_as_noise():
+    rng = np.random.default_rng(1)
+    t = np.arange(12 * SAMPLERATE) / SAMPLERATE
+    tone = np.where(t >= 2, 3000 * np.sin(2 * np.pi * 440 * t), 0)
+    out = denoise(tone + rng.normal(0, 300, len(t)))
+    assert kept(out, tone, (10, 12)) > 0.9
@@ -0,0 +1,119 @@
+import asyncio
+from types import SimpleNamespace
+
+from core.realtime_api_manager import RealtimeAPIClient
+from core.replay_buffer import ReplayBuffer
+
+
+def test_utterance_moves_from_open_to_sent_to_items():
+    buffer = ReplayBuffer()
+    buffer.append(b"ab")
+    assert len(buffer) == 2 and not buffer.pending()
+
+    buffer.commit(seq=3, trace="t")
+    assert buffer.pending()
+    assert buffer.committed("item_1") == (3, "t")
+    assert buffer.pending()
+
+    buffer.finished("item_1")
+    assert len(buffer) == 0 and not buffer.pending()
+
+
+def test_committed_without_sent_commit_is_ignored():
+    buffer = ReplayBuffer()
+    assert buffer.committed("item_1") == (None, None)
+    assert not buffer.pending()
+
+
+def test_commit_rejected_drops_oldest_sent_commit():
+    buffer = ReplayBuffer()
+    buffer.append(b"aa")
+    buffer.commit()
+    buffer.append(b"bbb")
+    buffer.commit()
+    buffer.commit_rejected()
+    assert len(buffer) == 3
+    utterances, _ = buffer.take()
+    assert [chunks for _, chunks, _, _ in utterances] == [[b"bbb"]]
+
+    buffer.commit_rejected()  # nothing sent: no-op
+    assert len(buffer) == 0
+
+
+def test_take_returns_items_then_sent_then_open():
+    buffer = ReplayBuffer()
+    for chunk in (b"1", b"2", b"3"):
+        buffer.append(chunk)
+        buffer.commit(seq=int(chunk))
+    buffer.committed("item_1")
+    buffer.committed("item_2")
+    buffer.append(b"4")
+
+    utterances, open_chunks = buffer.take()
+    assert utterances == [
+        ("item_1", [b"1"], 1, None),
+        ("item_2", [b"2"], 2, None),
+        (None, [b"3"], 3, None),
+    ]
+    assert open_chunks == [b"4"]
+    assert len(buffer) == 0 and not buffer.pending()
+    assert buffer.take() == ([], [])
+
+
+def test_trim_empties_oldest_utterances_but_keeps_them():
+    buffer = ReplayBuffer(max_bytes=4)
+    buffer.append(b"aa")
+    buffer.commit(seq=0)
+    buffer.committed("item_1")
+    buffer.append(b"bb")
+    buffer.commit()
+    buffer.append(b"cc")
+
+    assert len(buffer) == 4
+    utterances, open_chunks = buffer.take()
+    assert utterances == [("item_1", [], 0, None), (None, [b"bb"], None, None)]
+    assert open_chunks == [b"cc"]
+
+
+def test_trim_drops_open_chunks_last():
+    buffer = ReplayBuffer(max_bytes=4)
+    for chunk in (b"aa", b"bb", b"cc"):
+        buffer.append(chunk)
+    assert len(buffer) == 4
+    assert buffer.take() == ([], [b"bb", b"cc"])
+
+
+def test_finished_after_trim_keeps_size_consistent():
+    buffer = ReplayBuffer(max_bytes=2)
+    buffer.append(b"aa")
+    buffer.commit()
+    buffer.committed("item_1")
+    buffer.append(b"bb")
+    buffer.finished("item_1")
+    assert len(buffer) == 2 and not buffer.pending()
+
+
+class FakeSocket:
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, message):
+        self.messages.append(message)
+
+
+def test_replay_after_trim_gives_up_on_trimmed_item():
+    client = RealtimeAPIClient(audio_source=SimpleNamespace(samplerate=16000))
+    client.audio_replay = ReplayBuffer(max_bytes=4)
+    client.ws = FakeSocket()
+    client.audio_replay.append(b"aa")
+    client.audio_replay.commit()
+    asyncio.run(client._handle_audio_committed({"item_id": "item_1"}, None))
+    assert client.item_seqs == {"item_1": 0}
+    client.audio_replay.append(b"bbcc")  # trims item_1's audio
+
+    asyncio.run(client._replay_uncommitted_audio())  # as after a reconnect
+
+    assert client.item_seqs == {}
+    assert client.next_emit_seq == client.next_translation_seq == 1
+    assert client.is_idle()
+    assert len(client.audio_replay) == 4  # the open audio, appended again
@@ -0,0 +1,46 @@
+import asyncio
+
+from core.realtime_api_manager import RealtimeAPIClient, ends_sentence
+
+
+def make_client():
+    client = RealtimeAPIClient(audio_source=object())
+    client.translation_pool = []  # keep requests pending for inspection
+    return client
+
+
+def finish_with_speculation(client, prefix, text):
+    client.speculations["item"] = {
+        "seq": client._allocate_seq(),
+        "prefix": prefix,
+        "sentence": ends_sentence(prefix),
+        "state": "speculating",
+        "translation": "TRANSLATED PREFIX",
+    }
+    seq = client.speculations["item"]["seq"]
+    asyncio.run(client._translate_final_transcript("item", seq, text))
+    return [request["user_text"] for request in client.pending_response_requests]
+
+
+def test_sentence_prefix_is_reused_and_the_rest_joined():
+    client = make_client()
+    sent = finish_with_speculation(client, "I went home.", "I went home. Then I slept.")
+    assert sent == ["Then I slept."]
+    assert client.joins
+
+
+def test_mid_sentence_prefix_is_retranslated_whole():
+    client = make_client()
+    sent = finish_with_speculation(
+        client, "I want to go to the", "I want to go to the store tomorrow."
+    )
+    assert sent == ["I want to go to the store tomorrow."]
+    assert not client.joins
+
+
+def test_abbreviations_and_numbers_do_not_end_sentences():
+    assert ends_sentence("See you tomorrow.")
+    assert ends_sentence("本当ですか？")
+    assert not ends_sentence("I talked to Dr.")
+    assert not ends_sentence("Step 3.")
+    assert not ends_sentence("I want to go to the")
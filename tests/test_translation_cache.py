@@ -0,0 +1,17 @@
+import json
+
+from core.realtime_api_manager import RealtimeAPIClient
+from core.translation_cache import TranslationCache
+
+
+def test_save_translation_cache_writes_a_persistent_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    client = RealtimeAPIClient(audio_source=object())
+    client.translation_cache = TranslationCache(persistent=True)
+    client.translation_cache.put("hello", "prompt", "こんにちは")
+
+    client.save_translation_cache()
+
+    entries = json.loads(client.translation_cache.path.read_text(encoding="utf-8"))
+    assert [translation for _, translation in entries] == ["こんにちは"]
+    assert TranslationCache(persistent=True).get("hello", "prompt") == "こんにちは"
@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+from core.realtime_api_manager import RealtimeAPIClient
+
+
+def make_client(timeout=0.05):
+    # Any audio source gives an independent (non-singleton) client.
+    client = RealtimeAPIClient(audio_source=object())
+    client.translation_timeout = timeout
+    return client
+
+
+def send(client, connection):
+    seq = client._allocate_seq()
+    request = {
+        "mode": "translation",
+        "instructions": client.translation_prompt,
+        "user_text": f"text {seq}",
+        "seqs": [seq],
+    }
+    client._send_response_request(request, connection)
+    return request
+
+
+def finish(client, request, text):
+    request["text"] = text
+    client._on_response_done({"metadata": {"event_id": request["event_id"]}})
+
+
+def test_late_result_of_skipped_seq_is_dropped(connection):
+    client = make_client()
+    first = send(client, connection)
+    second = send(client, connection)
+    time.sleep(0.1)
+
+    finish(client, second, "second")  # first is skipped as timed out
+    assert client.next_emit_seq == 2
+    assert client.inflight_requests == {}
+
+    finish(client, first, "first")  # late: must not stall or loop
+    assert client.next_emit_seq == 2
+    assert client.translation_results == {}
+    assert not client._is_stalled(2)
+
+
+def test_skipped_request_frees_its_slot(connection):
+    client = make_client()
+    client.max_concurrent_responses = 2
+    stuck = send(client, connection)
+    done = send(client, connection)
+    time.sleep(0.1)
+    finish(client, done, "ok")
+    assert stuck["event_id"] not in client.inflight_requests
+    assert len(client.inflight_requests) < client.max_concurrent_responses
+
+
+def test_rejected_response_is_matched_by_error_event_id(connection):
+    client = make_client(timeout=30)
+    request = send(client, connection)
+    error = {
+        "type": "error",
+        "event_id": "event_server_1",
+        "error": {
+            "type": "invalid_request_error",
+            "code": "conversation_already_has_active_response",
+            "event_id": request["event_id"],
+        },
+    }
+    drop = asyncio.run(client._handle_error(error, connection))
+    assert drop is False
+    assert request["event_id"] not in client.inflight_requests
+    assert client.pending_response_requests == [request]
+
+
+def test_rejected_response_frees_its_slot_for_the_next(connection):
+    client = make_client(timeout=30)
+    client.max_concurrent_responses = 1
+    client.translation_pool = [connection]
+
+    async def run():
+        await client.send_translation("first")
+        await client.send_translation("second")
+        assert len(client.inflight_requests) == 1
+        rejected = next(iter(client.inflight_requests))
+        error = {
+            "type": "error",
+            "event_id": "event_server_2",
+            "error": {"type": "server_error", "event_id": rejected},
+        }
+        await client._handle_error(error, connection)
+
+    asyncio.run(run())
+    assert client.pending_response_requests == []
+    assert len(client.inflight_requests) == 1
+    assert [e["type"] for e in connection.sent] == ["response.create"] * 2
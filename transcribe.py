@@ -0,0 +1,16 @@
+import logging
+import sys
+from core.log_manager import setup_logging
+from core.config_manager import ConfigManager
+from core.config_keyingstorage import KeyringStorage
+from core.file_transcription import main
+
+if __name__ == "__main__":
+    setup_logging()
+    ConfigManager.configure(KeyringStorage())
+    try:
+        sys.exit(0 if main() else 1)
+    except KeyboardInterrupt:
+        logging.info(
+            "🛑 Stopped by user",
+        )
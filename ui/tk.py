@@ -1,19 +1,20 @@
 import os
 import tkinter as tk
-from tkinter import ttk
+from tkinter import filedialog, ttk
 from core.config_manager import ConfigManager
 from core.audio_manager import AudioStreamManager
 from core.message_types import UIMessageMixin, UIMessageType
+from core.ui_bus import UIBus
+from core.transcript_history import TranscriptHistory
+from core.log_manager import shutdown_logging
 from core.realtime_api_manager import (
     RealtimeAPIClient,
     DEFAULT_TRANSLATION_INSTRUCTIONS,
 )
 
 from core.config_keyingstorage import KeyringStorage
-from queue import Queue, Empty
-import datetime
 
-ui_queue = Queue()
+ui_queue = UIBus()
 UIMessageMixin.set_ui_queue(ui_queue)
 
 
@@ -40,6 +41,26 @@ def action_toggle_nr(nr_button_var):
     )
 
 
+def action_change_nr_mode(event):
+    mode = event.widget.get()
+    AudioStreamManager().set_noise_reduction_mode(mode)
+
+
+def action_toggle_speculative(speculative_var):
+    RealtimeAPIClient().set_speculative_translation(speculative_var.get())
+
+
+def action_toggle_prewarm(prewarm_var):
+    enabled = prewarm_var.get()
+    ConfigManager().set("PREWARM_SESSION", enabled)
+    if AudioStreamManager().is_on():
+        return
+    if enabled:
+        RealtimeAPIClient().prewarm()
+    else:
+        RealtimeAPIClient().stop()
+
+
 def action_change_silence_level(val):
     RealtimeAPIClient().set_commit_level(float(val))
 
@@ -85,7 +106,11 @@ def action_stop_audio():
     ui_queue.put(
         {"type": UIMessageType.SYS_LOG, "text": "🛑 AudioStream STOP requested"}
     )
-    RealtimeAPIClient().stop()
+    if ConfigManager().get("PREWARM_SESSION", False):
+        # Keep the session warm for the next Start.
+        RealtimeAPIClient().pause()
+    else:
+        RealtimeAPIClient().stop()
 
 
 def action_open_apikey_dialog(root):
@@ -104,8 +129,8 @@ def action_close_apikey_dialog(key):
 def action_save_prompt(prompt_widget):
     prompt = prompt_widget.get("1.0", "end").strip()
     if prompt:
+        # The client follows the prompt through its config subscription.
         ConfigManager().set_prompt(prompt)
-        RealtimeAPIClient().set_translation_prompt(prompt)
         ui_queue.put({"type": UIMessageType.SYS_LOG, "text": "📝 Prompt saved."})
     else:
         ui_queue.put(
@@ -113,6 +138,27 @@ def action_save_prompt(prompt_widget):
         )
 
 
+def action_export_transcript(transcript):
+    path = filedialog.asksaveasfilename(
+        title="Export Transcript",
+        defaultextension=".txt",
+        filetypes=[("Text", "*.txt")],
+    )
+    if not path:
+        return
+    try:
+        transcript.export(path)
+    except OSError as e:
+        ui_queue.put({"type": UIMessageType.SYS_LOG, "text": f"❌ Export failed: {e}"})
+        return
+    ui_queue.put(
+        {
+            "type": UIMessageType.SYS_LOG,
+            "text": f"💾 Transcript exported ({len(transcript)} lines): {path}",
+        }
+    )
+
+
 def action_open_ui():
     action_init()
     ui_queue.put(
@@ -121,11 +167,19 @@ def action_open_ui():
             "text": "🟢 UI Started",
         }
     )
-    show_ui(with_apikey_dialog=True if ConfigManager().get_api_key() is None else False)
+    api_key = ConfigManager().get_api_key()
+    if api_key and ConfigManager().get("PREWARM_SESSION", False):
+        RealtimeAPIClient().prewarm()
+    show_ui(with_apikey_dialog=True if api_key is None else False)
 
 
 def action_close_ui():
     action_stop_audio()
+    # os._exit skips atexit and the runner's own cache save: save settings,
+    # the translation cache and queued log records first.
+    ConfigManager().flush()
+    RealtimeAPIClient().save_translation_cache()
+    shutdown_logging()
     os._exit(0)
 
 
@@ -246,6 +300,11 @@ def show_ui(with_apikey_dialog=False):
     log_label = tk.Label(root, text="Logs:", font=("Arial", 11, "bold"))
     log_label.pack(anchor="w", padx=10, pady=(10, 0))
 
+    # Bounded view: the newest TRANSCRIPT_MAX_LINES lines; the full session
+    # stays available through Export.
+    transcript = TranscriptHistory(
+        max_entries=ConfigManager().get("TRANSCRIPT_MAX_LINES", 500)
+    )
     log_text = tk.Text(root, height=10, wrap="word")
     log_text.tag_config("gray", foreground="lightgray")
     log_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
@@ -292,6 +351,35 @@ def show_ui(with_apikey_dialog=False):
     )
     nr_button.pack(pady=5)
 
+    nr_mode_var = tk.StringVar(value=AudioStreamManager().noise_reduction_mode)
+    nr_mode_combo = ttk.Combobox(
+        root,
+        values=AudioStreamManager().get_noise_reduction_modes(),
+        textvariable=nr_mode_var,
+        state="readonly",
+        width=12,
+    )
+    nr_mode_combo.pack(pady=(0, 5))
+    nr_mode_combo.bind("<<ComboboxSelected>>", action_change_nr_mode)
+
+    speculative_var = tk.BooleanVar(value=RealtimeAPIClient().speculative_translation)
+    speculative_check = ttk.Checkbutton(
+        root,
+        text="Speculative translation (translate before transcription completes)",
+        variable=speculative_var,
+        command=lambda: action_toggle_speculative(speculative_var),
+    )
+    speculative_check.pack(pady=(0, 5))
+
+    prewarm_var = tk.BooleanVar(value=ConfigManager().get("PREWARM_SESSION", False))
+    prewarm_check = ttk.Checkbutton(
+        root,
+        text="Pre-warm session (connect before the mic starts)",
+        variable=prewarm_var,
+        command=lambda: action_toggle_prewarm(prewarm_var),
+    )
+    prewarm_check.pack(pady=(0, 5))
+
     # =========================
     # Audio Input Device Select
     # =========================
@@ -353,6 +441,14 @@ def show_ui(with_apikey_dialog=False):
     )
     change_key_button.pack(side="left", padx=10)
 
+    # Export the whole session transcript
+    export_button = ttk.Button(
+        button_row,
+        text="Export Log",
+        command=lambda: action_export_transcript(transcript),
+    )
+    export_button.pack(side="left", padx=10)
+
     # Start Audio
     start_btn = ttk.Button(button_row, text="Start Audio", command=action_start_audio)
     start_btn.pack(side="left", padx=10)
@@ -375,45 +471,109 @@ def show_ui(with_apikey_dialog=False):
     )
     sys_log_label_value.pack(fill="x", padx=10, pady=(0, 11))
 
-    # Update UI by Queue message
-    def poll_queue():
+    # Speech-to-translation latency (p50 / p95 of recent utterances)
+    latency_var = tk.StringVar()
+    latency_label = tk.Label(
+        root,
+        textvariable=latency_var,
+        font=("Arial", 11),
+        fg="gray",
+        anchor="w",
+    )
+    latency_label.pack(fill="x", padx=10, pady=(0, 11))
+
+    def log_line(msg, icon, *tags):
+        line = transcript.add(icon, msg.get("text", ""), msg["ts"])
+        # Follow new lines only if the view is already at the bottom.
+        follow = log_text.yview()[1] >= 1.0
+        log_text.insert("end", line + "\n", *tags)
+        excess = int(log_text.index("end-1c").split(".")[0]) - 1
+        excess -= transcript.max_entries
+        if excess > 0:
+            log_text.delete("1.0", f"{excess + 1}.0")
+        if follow:
+            log_text.see("end")
+
+    # Update UI from the bus: only woken when messages are pending, and only
+    # the newest value of each channel is rendered.
+    def render_messages():
+        events, values = ui_queue.drain()
+        for msg in events:
+            mtype = msg.get("type")
+            if mtype == UIMessageType.CAPTION:
+                caption_var.set(msg.get("text", ""))
+                log_line(msg, "👂")
+            elif mtype == UIMessageType.TRANSLATED:
+                translated_var.set(msg.get("text", ""))
+                log_line(msg, "♻️", "gray")
+            elif mtype == UIMessageType.AUDIO_STOPPED:
+                volume_var.set(0)
+                volume_text_var.set("0")
+            elif mtype == UIMessageType.AUDIO_STARTED:
+                volume_bar.configure(style="TProgressbar")
+                start_volume_sampling()
+
+        if "caption" in values:
+            caption_var.set(values["caption"].get("text", ""))
+        if "translation" in values:
+            # Streaming translation: update the label in place; the log gets
+            # the final text from TRANSLATED.
+            translated_var.set(values["translation"].get("text", ""))
+        if "volume" in values:
+            show_volume(float(values["volume"].get("text", 0)))
+        if "status" in values:
+            sys_log_var.set(values["status"].get("text", ""))
+        if "latency" in values:
+            latency_var.set(values["latency"].get("text", ""))
+
+    def show_volume(level):
+        text = f"{level:.2f}"
+        if text != volume_text_var.get():
+            volume_var.set(min(level, MAX_VOLUME))
+            volume_text_var.set(text)
+
+    # The capture callback posts no VOLUME messages; the meter samples the
+    # latest block level, and only while the mic is on.
+    volume_sampling = False
+
+    def start_volume_sampling():
+        nonlocal volume_sampling
+        if not volume_sampling:
+            volume_sampling = True
+            sample_volume()
+
+    def sample_volume():
+        nonlocal volume_sampling
+        manager = AudioStreamManager()
+        if not manager.is_on():
+            volume_sampling = False
+            show_volume(0.0)
+            return
+        show_volume(manager.latest_volume())
+        root.after(100, sample_volume)
+
+    # The waker runs on the posting thread (audio / asyncio). Calling Tk from
+    # there would block it until the main loop serves the call, so it only
+    # writes a byte to a pipe that Tk watches.
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_r, False)
+    os.set_blocking(wake_w, False)
+
+    def wake_ui():
+        try:
+            os.write(wake_w, b"\0")
+        except BlockingIOError:
+            pass  # the pipe already holds a wake-up
+        except OSError:
+            return False
+
+    def on_wake(fd, mask):
         try:
-            while True:
-                msg = ui_queue.get_nowait()
-                mtype = msg.get("type")
-                if mtype == UIMessageType.CAPTION:
-                    text = msg.get("text", "")
-                    caption_var.set(text)
-
-                    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-                    log_text.insert(
-                        "1.0",
-                        f"[{timestamp}]" + "👂" + text + "\n",
-                    )
-                    log_text.yview_moveto(0)
-                elif mtype == UIMessageType.TRANSLATED:
-                    text = msg.get("text", "")
-                    translated_var.set(text)
-                    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-                    log_text.insert("1.0", f"[{timestamp}]" + "♻️" + text + "\n", "gray")
-                    log_text.yview_moveto(0)
-                elif mtype == UIMessageType.VOLUME:
-                    level = min(float(msg.get("text", 0)), MAX_VOLUME)
-                    volume_var.set(level)
-                    volume_text_var.set(f"{float(msg.get('text', 0)):.2f}")
-                elif mtype == UIMessageType.LOG:
-                    text = msg.get("text", "")
-                    sys_log_var.set(text)
-                elif mtype == UIMessageType.AUDIO_STOPPED:
-                    volume_var.set(0)
-                    volume_text_var.set("0")
-                elif mtype == UIMessageType.AUDIO_STARTED:
-                    volume_bar.configure(style="TProgressbar")
-                elif mtype == UIMessageType.SYS_LOG:
-                    sys_log_var.set(msg.get("text", ""))
-        except Empty:
+            os.read(fd, 4096)
+        except BlockingIOError:
             pass
-        root.after(50, poll_queue)
+        render_messages()
 
-    poll_queue()
+    root.tk.createfilehandler(wake_r, tk.READABLE, on_wake)
+    ui_queue.set_waker(wake_ui)
     root.mainloop()